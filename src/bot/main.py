@@ -18,6 +18,23 @@ from src.rag.rag_pipeline import RAGPipeline
 
 logger = structlog.get_logger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Basic content filtering - one alternation so each message is scanned once
+_SUSPICIOUS_RE = re.compile(
+    "|".join(
+        [
+            r"<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>",  # Script tags
+            r"javascript:",  # JavaScript URLs
+            r"data:text/html",  # Data URLs
+            r"vbscript:",  # VBScript
+            r"onload\s*=",  # Event handlers
+            r"onerror\s*=",  # Error handlers
+        ]
+    ),
+    re.IGNORECASE,
+)
+
 
 def validate_user_input(text: str) -> tuple[bool, str]:
     """
@@ -33,25 +50,15 @@ def validate_user_input(text: str) -> tuple[bool, str]:
         return False, "Message is empty"
 
     # Remove excessive whitespace
-    sanitized = re.sub(r"\s+", " ", text.strip())
+    sanitized = _WHITESPACE_RE.sub(" ", text.strip())
 
     # Check length limits (reasonable for chat messages)
     if len(sanitized) > 4000:
         return False, "Message too long (max 4000 characters)"
 
-    # Basic content filtering - reject messages with suspicious patterns
-    suspicious_patterns = [
-        r"<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>",  # Script tags
-        r"javascript:",  # JavaScript URLs
-        r"data:text/html",  # Data URLs
-        r"vbscript:",  # VBScript
-        r"onload\s*=",  # Event handlers
-        r"onerror\s*=",  # Error handlers
-    ]
-
-    for pattern in suspicious_patterns:
-        if re.search(pattern, sanitized, re.IGNORECASE):
-            return False, "Message contains potentially harmful content"
+    # Reject messages with suspicious patterns
+    if _SUSPICIOUS_RE.search(sanitized):
+        return False, "Message contains potentially harmful content"
 
     return True, sanitized
 
@@ -62,13 +62,20 @@ def get_settings() -> AppSettings:
             concurrent_groups=max(
                 1, min(5, int(os.getenv("TELEGRAM_CONCURRENT_GROUPS", "1")))
             ),  # Validate range 1-5
+            concurrent_topics=max(
+                1, min(5, int(os.getenv("TELEGRAM_CONCURRENT_TOPICS", "4")))
+            ),  # Validate range 1-5
             messages_per_request=int(os.getenv("TELEGRAM_MESSAGES_PER_REQUEST", "200")),
-            buffer_size=int(os.getenv("TELEGRAM_BUFFER_SIZE", "1000")),
+            buffer_size=int(os.getenv("TELEGRAM_BUFFER_SIZE", "4000")),
             ui_update_interval=int(os.getenv("TELEGRAM_UI_UPDATE_INTERVAL", "3")),
-            batch_size=int(os.getenv("TELEGRAM_BATCH_SIZE", "250")),
+            batch_size=int(os.getenv("TELEGRAM_BATCH_SIZE", "1000")),
+            max_batch_bytes=int(
+                os.getenv("TELEGRAM_MAX_BATCH_BYTES", str(4 * 1024 * 1024))
+            ),
             progress_update_messages=int(
                 os.getenv("TELEGRAM_PROGRESS_UPDATE_MESSAGES", "100")
             ),
+            group_meta_ttl=int(os.getenv("TELEGRAM_GROUP_META_TTL", str(6 * 60 * 60))),
         ),
     )
 
@@ -12,13 +12,16 @@ class TelegramExtractionSettings:
     """Settings for Telegram message extraction process."""
 
     concurrent_groups: int = 1  # Process one group at a time to avoid rate limits
+    concurrent_topics: int = 4  # Forum topics extracted in parallel per group
     messages_per_request: int = (
         100  # Optimized for Telegram API limits (max 100 per call)
     )
-    buffer_size: int = 1000  # Reduced from 2000 to save memory
+    buffer_size: int = 4000  # Rows committed together, across concurrent topics
     ui_update_interval: int = 2  # Good balance of responsiveness and performance
-    batch_size: int = 250  # Default batch size for message processing
+    batch_size: int = 1000  # Messages handed to storage at a time
+    max_batch_bytes: int = 4 * 1024 * 1024  # Flush a batch early past this payload
     progress_update_messages: int = 100  # Update progress every N messages
+    group_meta_ttl: int = 6 * 60 * 60  # Seconds cached group/topic metadata stays fresh
 
 
 @dataclass
@@ -58,6 +61,7 @@ class PathSettings:
     user_map_file: str = field(init=False)
     synthesis_progress_file: str = field(init=False)
     tracking_file: str = field(init=False)
+    group_meta_file: str = field(init=False)
     failed_batches_file: str = field(init=False)
     processed_hashes_file: str = field(init=False)
     prompt_file: str = field(init=False)
@@ -82,6 +86,7 @@ class PathSettings:
             self.processed_data_dir, "synthesis_progress.json"
         )
         self.tracking_file = os.path.join(self.data_dir, "last_msg_ids.json")
+        self.group_meta_file = os.path.join(self.data_dir, "group_meta.json")
         self.failed_batches_file = os.path.join(self.data_dir, "failed_batches.jsonl")
         self.processed_hashes_file = os.path.join(
             self.processed_data_dir, "processed_hashes.json"
@@ -119,10 +119,10 @@ def validate_configuration(
             f"Values outside this range may cause UI issues or unnecessary I/O overhead."
         )
 
-    if telegram.extraction.batch_size < 50 or telegram.extraction.batch_size > 1000:
+    if telegram.extraction.batch_size < 50 or telegram.extraction.batch_size > 5000:
         logger = logging.getLogger(__name__)
         logger.warning(
-            f"TELEGRAM_BATCH_SIZE ({telegram.extraction.batch_size}) should be between 50 and 1000. "
+            f"TELEGRAM_BATCH_SIZE ({telegram.extraction.batch_size}) should be between 50 and 5000. "
             f"Values outside this range may cause performance issues or memory problems."
         )
 
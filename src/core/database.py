@@ -1,8 +1,11 @@
 import os
 import sqlite3
 import threading
+import weakref
 from contextlib import contextmanager
-from typing import Any, Dict, List
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from src.core.config import PathSettings
 from src.core.di.interfaces import DatabaseInterface
@@ -13,6 +16,44 @@ from src.core.serializer import (
     serialize_extra_data,
 )
 
+MESSAGE_COLUMNS = (
+    "id",
+    "source_group_id",
+    "topic_id",
+    "date",
+    "sender_id",
+    "message_type",
+    "content",
+    "extra_data",
+    "reply_to_msg_id",
+    "topic_title",
+    "source_name",
+    "ingestion_timestamp",
+)
+# SQLite builds older than 3.32 cap a statement at 999 bound parameters
+MAX_SQL_PARAMS = 999
+MESSAGE_ROWS_PER_INSERT = MAX_SQL_PARAMS // len(MESSAGE_COLUMNS)
+
+
+@lru_cache(maxsize=None)
+def _message_insert_sql(row_count: int) -> str:
+    """Build (and cache) a multi-row INSERT for ``row_count`` messages."""
+    row = "(" + ", ".join("?" * len(MESSAGE_COLUMNS)) + ")"
+    return (
+        f"INSERT OR REPLACE INTO messages ({', '.join(MESSAGE_COLUMNS)}) "
+        f"VALUES {', '.join([row] * row_count)}"
+    )
+
+
+def _close_connections(connections: List[sqlite3.Connection], lock: threading.Lock):
+    """Close every registered connection; safe to call more than once."""
+    with lock:
+        while connections:
+            try:
+                connections.pop().close()
+            except Exception:
+                pass  # Ignore cleanup errors
+
 
 class Database(DatabaseInterface):
     def __init__(self, settings: PathSettings, pool_size: int = 10):  # Back to 10
@@ -25,6 +66,13 @@ class Database(DatabaseInterface):
                 pass
         # Use thread-local storage for connections to ensure thread safety
         self.local = threading.local()
+        # Registry of every per-thread connection so they can all be closed
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Close them on garbage collection or at interpreter exit
+        self._finalizer = weakref.finalize(
+            self, _close_connections, self._connections, self._connections_lock
+        )
         # Initialize shared connection for table creation
         self.shared_conn = sqlite3.connect(self.db_path)
         self.shared_conn.execute(
@@ -43,12 +91,20 @@ class Database(DatabaseInterface):
     def _get_thread_local_connection(self):
         """Get a thread-local connection to the database."""
         if not hasattr(self.local, "connection"):
-            # Create a new connection for this thread
-            self.local.connection = sqlite3.connect(self.db_path)
+            # Create a new connection for this thread. isolation_level=None
+            # disables the driver's implicit transactions so bulk writes can
+            # manage their own BEGIN IMMEDIATE ... COMMIT (see _transaction).
+            self.local.connection = sqlite3.connect(
+                self.db_path, isolation_level=None, check_same_thread=False
+            )
             self.local.connection.execute("PRAGMA journal_mode=WAL")
             self.local.connection.execute("PRAGMA synchronous=NORMAL")
             self.local.connection.execute("PRAGMA cache_size=5000")
             self.local.connection.execute("PRAGMA temp_store=MEMORY")
+            # Ensure tables exist once per connection rather than on every call
+            self._create_tables(self.local.connection)
+            with self._connections_lock:
+                self._connections.append(self.local.connection)
         return self.local.connection
 
     @contextmanager
@@ -56,8 +112,6 @@ class Database(DatabaseInterface):
         """Get a thread-safe connection to the database."""
         conn = self._get_thread_local_connection()
         try:
-            # Ensure tables exist (though they should already exist)
-            self._create_tables(conn)
             yield conn
         except Exception as e:
             conn.rollback()
@@ -67,6 +121,20 @@ class Database(DatabaseInterface):
         # Note: We don't close the connection here to allow for connection reuse
         # The connection will be closed when the Database instance is destroyed
 
+    @contextmanager
+    def _transaction(self):
+        """Run a block of writes inside a single explicit write transaction."""
+        with self._get_connection() as conn:
+            # Take the write lock up front so the whole batch commits at once
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+
     def _create_tables(self, conn: sqlite3.Connection):
         cursor = conn.cursor()
         cursor.execute(
@@ -111,16 +179,70 @@ class Database(DatabaseInterface):
             )
             """
         )
+
+        # Resume cursor per topic, written with the rows it covers
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cursors (
+                source_group_id INTEGER,
+                topic_id INTEGER,
+                last_id INTEGER,
+                PRIMARY KEY (source_group_id, topic_id)
+            )
+            """
+        )
         conn.commit()
 
     def insert_messages(self, messages: List[Dict[str, Any]]):
-        with self._get_connection() as conn:
+        if not messages:
+            return
+        with self._transaction() as conn:
             cursor = conn.cursor()
             self._batch_insert_messages(cursor, messages)
-            conn.commit()
 
-    def insert_topics(self, topics: List[Any], source_group_id: int):
+    def insert_message_rows(
+        self,
+        rows: Sequence[Tuple[Any, ...]],
+        cursors: Optional[Mapping[Tuple[int, int], int]] = None,
+    ):
+        """
+        Insert rows that are already serialized for storage.
+
+        Args:
+            rows: Tuples whose values follow MESSAGE_COLUMNS order, with dates,
+                content and extra_data already converted to strings.
+            cursors: Optional last saved message ID per (group_id, topic_id),
+                committed in the same transaction as the rows.
+        """
+        if not rows:
+            return
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            self._insert_rows(cursor, rows)
+            if cursors:
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO cursors (source_group_id, topic_id, last_id)
+                    VALUES (?, ?, ?)
+                    """,
+                    [(*key, last_id) for key, last_id in cursors.items()],
+                )
+
+    def get_cursors(self) -> Dict[Tuple[int, int], int]:
+        """
+        Returns the last saved message ID of every extracted topic.
+
+        Returns:
+            A dictionary mapping (group_id, topic_id) to the last message ID.
+        """
         with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT source_group_id, topic_id, last_id FROM cursors"
+            ).fetchall()
+        return {(group_id, topic_id): last_id for group_id, topic_id, last_id in rows}
+
+    def insert_topics(self, topics: List[Any], source_group_id: int):
+        with self._transaction() as conn:
             cursor = conn.cursor()
             topic_data = [
                 (
@@ -142,7 +264,6 @@ class Database(DatabaseInterface):
                 """,
                 topic_data,
             )
-            conn.commit()
 
     def _batch_insert_messages(self, cursor, messages: List[Dict[str, Any]]):
         """Batch insert messages for improved performance."""
@@ -176,16 +297,16 @@ class Database(DatabaseInterface):
                 )
             )
 
-        # Batch insert messages with executemany for better performance
-        if message_data:
-            cursor.executemany(
-                """
-                INSERT OR REPLACE INTO messages (
-                    id, source_group_id, topic_id, date, sender_id, message_type, content, extra_data,
-                    reply_to_msg_id, topic_title, source_name, ingestion_timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                message_data,
+        self._insert_rows(cursor, message_data)
+
+    def _insert_rows(self, cursor, rows: Sequence[Tuple[Any, ...]]):
+        """Write MESSAGE_COLUMNS-ordered rows with as few statements as possible."""
+        # Bind many rows per statement with multi-row VALUES: this runs far
+        # fewer statements through SQLite's VM than executemany over one row
+        for start in range(0, len(rows), MESSAGE_ROWS_PER_INSERT):
+            chunk = rows[start : start + MESSAGE_ROWS_PER_INSERT]
+            cursor.execute(
+                _message_insert_sql(len(chunk)), list(chain.from_iterable(chunk))
             )
 
     def _insert_message(self, cursor, msg: Dict[str, Any]):
@@ -218,6 +339,12 @@ class Database(DatabaseInterface):
         )
 
     def get_all_messages(self):
+        """Yield every message in chronological order.
+
+        The ORDER BY is served by an index scan over idx_messages_date, so no
+        sort happens in SQLite. Dates are stored as ISO-8601 strings, whose
+        lexicographic order matches chronological order.
+        """
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM messages ORDER BY date")
@@ -292,19 +419,9 @@ class Database(DatabaseInterface):
         """
         Close all database connections to ensure clean shutdown.
         """
-        # Close thread-local connection if it exists
-        if hasattr(self.local, "connection"):
-            try:
-                # Commit any pending transactions before closing
-                self.local.connection.commit()
-                self.local.connection.close()
-                delattr(self.local, "connection")
-            except Exception:
-                pass  # Ignore cleanup errors
-
-    def __del__(self):
-        """Ensure all connections are closed when the Database instance is destroyed."""
-        self.close_all_connections()
+        _close_connections(self._connections, self._connections_lock)
+        # Drop every thread's cached handle so the next call reconnects
+        self.local = threading.local()
 
     def clear_all_messages(self):
         """
@@ -6,7 +6,7 @@ the application, enabling dependency injection and easier testing.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from chromadb.api.models.Collection import Collection
 
@@ -124,6 +124,20 @@ class DatabaseInterface(ABC):
         """Insert messages into the database."""
         pass
 
+    @abstractmethod
+    def insert_message_rows(
+        self,
+        rows: Sequence[Tuple[Any, ...]],
+        cursors: Optional[Mapping[Tuple[int, int], int]] = None,
+    ):
+        """Insert pre-serialized message rows and their topic cursors."""
+        pass
+
+    @abstractmethod
+    def get_cursors(self) -> Dict[Tuple[int, int], int]:
+        """Get the last saved message ID of every extracted topic."""
+        pass
+
     @abstractmethod
     def _get_connection(self):
         """Get a database connection."""
@@ -69,7 +69,7 @@ class CheckpointManager:
             os.makedirs(os.path.dirname(self.checkpoint_file), exist_ok=True)
             with open(self.checkpoint_file, "w") as f:
                 json.dump(kwargs, f)
-            logger.debug(f"Checkpoint saved to {self.checkpoint_file}")
+            logger.debug("Checkpoint saved", path=self.checkpoint_file)
         except Exception as e:
             logger.warning(f"Failed to save checkpoint: {e}")
 
@@ -86,10 +86,10 @@ class CheckpointManager:
             with open(self.checkpoint_file, "r") as f:
                 data = json.load(f)
             self.last_checkpoint = data
-            logger.debug(f"Checkpoint loaded from {self.checkpoint_file}")
+            logger.debug("Checkpoint loaded", path=self.checkpoint_file)
             return data
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.debug(f"No checkpoint found or invalid checkpoint: {e}")
+            logger.debug("No checkpoint found or invalid checkpoint", error=str(e))
             return {}
 
     def clear_checkpoint(self) -> None:
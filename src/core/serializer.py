@@ -6,9 +6,26 @@ database storage formats.
 """
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict
 
+import orjson
+from dateutil.parser import isoparse
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback for values json can't encode: ISO dates, else their str()."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps(value: Any) -> str:
+    """Encode to a JSON string with orjson, which handles datetimes natively."""
+    return orjson.dumps(
+        value, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
 
 def serialize_extra_data(extra_data: Dict[str, Any]) -> str:
     """Serialize extra_data dictionary to JSON string, handling datetime objects."""
@@ -35,22 +52,16 @@ def serialize_extra_data(extra_data: Dict[str, Any]) -> str:
             # If it's not a dict and not a string, convert to string
             return json.dumps({"value": str(extra_data)})
 
-    # At this point, extra_data should be a dict
-    # Create a copy of the dictionary to avoid modifying the original
-    serializable_data = {}
-    for key, value in extra_data.items():
-        if isinstance(value, datetime):
-            serializable_data[key] = value.isoformat()
-        else:
-            # Handle non-serializable objects
-            try:
-                json.dumps(value)  # Test if value is JSON serializable
-                serializable_data[key] = value
-            except (TypeError, ValueError):
-                # If not serializable, convert to string
-                serializable_data[key] = str(value)
-
-    return json.dumps(serializable_data)
+    # At this point, extra_data should be a dict. Encode it in a single call;
+    # the default hook stringifies only the values orjson can't handle.
+    try:
+        return _dumps(extra_data)
+    except TypeError:
+        # Keys orjson can't encode (e.g. tuples), or ints wider than 64 bits
+        return json.dumps(
+            {str(key): value for key, value in extra_data.items()},
+            default=_json_default,
+        )
 
 
 def deserialize_extra_data(extra_data_str: str) -> Dict[str, Any]:
@@ -70,7 +81,8 @@ def serialize_content(content: Any) -> str:
         return content
 
     try:
-        return json.dumps(content)
+        # Nested datetimes (e.g. a poll's close_date) become ISO strings
+        return _dumps(content)
     except (TypeError, ValueError):
         # If content is not JSON serializable, convert to string
         return str(content)
@@ -97,3 +109,11 @@ def serialize_date(date_value: Any) -> str:
     except (TypeError, ValueError):
         # If not serializable, convert to string
         return str(date_value)
+
+
+def date_to_timestamp(date_value: str) -> float:
+    """Parse a stored ISO-8601 date into epoch seconds; naive dates are UTC."""
+    dt = isoparse(date_value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
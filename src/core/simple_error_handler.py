@@ -7,6 +7,7 @@ the application to ensure consistent error logging and handling.
 
 import asyncio
 import functools
+import random
 import time
 from typing import Any, Callable, Tuple, Type
 
@@ -35,9 +36,10 @@ def log_exception(func: Callable) -> Callable:
             return await func(*args, **kwargs)
         except Exception as e:
             logger.error(
-                f"Exception in {func.__name__}: {str(e)}",
+                "Exception in wrapped function",
                 exc_info=True,
                 func_name=func.__name__,
+                error=str(e),
             )
             raise
 
@@ -47,9 +49,10 @@ def log_exception(func: Callable) -> Callable:
             return func(*args, **kwargs)
         except Exception as e:
             logger.error(
-                f"Exception in {func.__name__}: {str(e)}",
+                "Exception in wrapped function",
                 exc_info=True,
                 func_name=func.__name__,
+                error=str(e),
             )
             raise
 
@@ -62,6 +65,8 @@ def retry_on_failure(
     delay: float = 1.0,
     backoff: float = 2.0,
     retryable_exceptions: Tuple[Type[Exception], ...] = RETRYABLE_EXCEPTIONS,
+    max_delay: float = 30.0,
+    jitter: bool = True,
 ):
     """
     Decorator to retry a function on failure.
@@ -71,40 +76,66 @@ def retry_on_failure(
         delay: Initial delay between retries in seconds
         backoff: Multiplier applied to delay after each retry
         retryable_exceptions: Tuple of exceptions that should trigger retries
+        max_delay: Upper bound on the delay between retries in seconds
+        jitter: Sleep a random time up to the current delay ("full jitter") so
+            concurrent callers don't all retry at the same instant
     """
 
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            last_exception = None
-            current_delay = delay
+    def next_sleep(current_delay: float) -> float:
+        sleep_for = min(current_delay, max_delay)
+        return random.uniform(0, sleep_for) if jitter else sleep_for
 
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except retryable_exceptions as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(
-                            f"Retryable error in {func.__name__} (attempt {attempt + 1}/{max_retries + 1}): {e}"
-                        )
-                        await asyncio.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
+    def decorator(func: Callable) -> Callable:
+        # Nothing to retry: hand back the function itself so hot callers don't
+        # pay for a wrapper frame and retry loop on every call.
+        if max_retries <= 0:
+            return func
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                last_exception = None
+                current_delay = delay
+
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except retryable_exceptions as e:
+                        last_exception = e
+                        if attempt < max_retries:
+                            logger.warning(
+                                "Retryable error, retrying",
+                                func_name=func.__name__,
+                                attempt=attempt + 1,
+                                max_attempts=max_retries + 1,
+                                error=str(e),
+                            )
+                            await asyncio.sleep(next_sleep(current_delay))
+                            current_delay = min(current_delay * backoff, max_delay)
+                        else:
+                            logger.error(
+                                "Retries exhausted",
+                                func_name=func.__name__,
+                                max_attempts=max_retries + 1,
+                                error=str(e),
+                                exc_info=True,
+                            )
+                            raise
+                    except Exception as e:
+                        # Non-retryable exception
                         logger.error(
-                            f"Function {func.__name__} failed after {max_retries + 1} attempts: {e}",
+                            "Non-retryable error",
+                            func_name=func.__name__,
+                            error=str(e),
                             exc_info=True,
                         )
                         raise
-                except Exception as e:
-                    # Non-retryable exception
-                    logger.error(
-                        f"Non-retryable error in {func.__name__}: {e}", exc_info=True
-                    )
-                    raise
 
-            # This should never be reached, but just in case
-            raise last_exception or Exception("Unknown error in retry mechanism")
+                # This should never be reached, but just in case
+                raise last_exception or Exception("Unknown error in retry mechanism")
+
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -118,28 +149,37 @@ def retry_on_failure(
                     last_exception = e
                     if attempt < max_retries:
                         logger.warning(
-                            f"Retryable error in {func.__name__} (attempt {attempt + 1}/{max_retries + 1}): {e}"
+                            "Retryable error, retrying",
+                            func_name=func.__name__,
+                            attempt=attempt + 1,
+                            max_attempts=max_retries + 1,
+                            error=str(e),
                         )
-                        time.sleep(current_delay)
-                        current_delay *= backoff
+                        time.sleep(next_sleep(current_delay))
+                        current_delay = min(current_delay * backoff, max_delay)
                     else:
                         logger.error(
-                            f"Function {func.__name__} failed after {max_retries + 1} attempts: {e}",
+                            "Retries exhausted",
+                            func_name=func.__name__,
+                            max_attempts=max_retries + 1,
+                            error=str(e),
                             exc_info=True,
                         )
                         raise
                 except Exception as e:
                     # Non-retryable exception
                     logger.error(
-                        f"Non-retryable error in {func.__name__}: {e}", exc_info=True
+                        "Non-retryable error",
+                        func_name=func.__name__,
+                        error=str(e),
+                        exc_info=True,
                     )
                     raise
 
             # This should never be reached, but just in case
             raise last_exception or Exception("Unknown error in retry mechanism")
 
-        # Return the appropriate wrapper based on whether the function is async
-        return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+        return sync_wrapper
 
     return decorator
 
@@ -161,8 +201,9 @@ def safe_call(func: Callable, *args, **kwargs) -> Any:
         return True, result
     except Exception as e:
         logger.error(
-            f"Safe call failed for {func.__name__}: {str(e)}",
+            "Safe call failed",
             exc_info=True,
             func_name=func.__name__,
+            error=str(e),
         )
         return False, e
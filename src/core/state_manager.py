@@ -57,9 +57,9 @@ class StateManager:
             with state_file_lock:
                 with open(self.checkpoint_file, "w") as f:
                     json.dump(kwargs, f)
-            logger.debug(f"Checkpoint saved to {self.checkpoint_file}")
+            logger.debug("Checkpoint saved", path=self.checkpoint_file)
         except Exception as e:
-            logger.warning(f"Failed to save checkpoint: {e}")
+            logger.warning("Failed to save checkpoint", error=str(e))
 
     def load_checkpoint(self) -> Dict[str, Any]:
         """
@@ -73,10 +73,10 @@ class StateManager:
                 with open(self.checkpoint_file, "r") as f:
                     data = json.load(f)
             self.last_checkpoint = data
-            logger.debug(f"Checkpoint loaded from {self.checkpoint_file}")
+            logger.debug("Checkpoint loaded", path=self.checkpoint_file)
             return data
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.debug(f"No checkpoint found or invalid checkpoint: {e}")
+            logger.debug("No checkpoint found or invalid checkpoint", error=str(e))
             return {}
 
     def clear_checkpoint(self) -> None:
@@ -87,7 +87,7 @@ class StateManager:
                 os.remove(self.checkpoint_file)
             logger.debug("Checkpoint cleared")
         except Exception as e:
-            logger.warning(f"Failed to clear checkpoint: {e}")
+            logger.warning("Failed to clear checkpoint", error=str(e))
 
     # Progress Tracking
     def save_progress(self, last_processed_index: int) -> None:
@@ -103,7 +103,7 @@ class StateManager:
                 with open(self.progress_file, "w") as f:
                     json.dump({"last_processed_index": last_processed_index}, f)
         except Exception as e:
-            logger.warning(f"Failed to save progress: {e}")
+            logger.warning("Failed to save progress", error=str(e))
 
     def load_progress(self) -> int:
         """
@@ -150,7 +150,7 @@ class StateManager:
                     json.dump(list(hashes), f)
         except IOError:
             logger.error(
-                f"Failed to save processed hashes to {self.processed_hashes_file}"
+                "Failed to save processed hashes", path=self.processed_hashes_file
             )
 
     # Failed Batch Handling
@@ -180,4 +180,4 @@ class StateManager:
                     )
                     f.write("\n")
         except IOError as e:
-            logger.error(f"Failed to save failed batch: {e}")
+            logger.error("Failed to save failed batch", error=str(e))
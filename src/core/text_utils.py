@@ -14,6 +14,35 @@ NUMBER_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Most messages contain no digits at all; one search for a digit is much
+# cheaper than running NUMBER_RE over the whole text
+_DIGIT_RE = re.compile(r"\d")
+
+# Translation table that deletes thousands separators in a single C-level pass
+_COMMA_STRIP = str.maketrans("", "", ",")
+
+# Canonical (lowercase) unit for the spellings we expect to see, so the common
+# case is a dict hit instead of allocating a new lowercased string per match
+_UNIT_LOWER = {
+    spelling: unit
+    for unit in (
+        "%",
+        "percent",
+        "rs",
+        "inr",
+        "₹",
+        "km",
+        "m",
+        "kg",
+        "k",
+        "lakh",
+        "crore",
+        "million",
+        "billion",
+    )
+    for spelling in (unit, unit.upper(), unit.title())
+}
+
 
 def normalize_numbers(text: str) -> List[Dict[str, Any]]:
     """
@@ -25,18 +54,25 @@ def normalize_numbers(text: str) -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries containing extracted numeric information
     """
+    if not _DIGIT_RE.search(text):
+        return []
     results = []
     for m in NUMBER_RE.finditer(text):
-        num_str = m.group("number").replace(",", "")
+        num_str = m.group("number").translate(_COMMA_STRIP)
         try:
             val = float(num_str)
         except ValueError:
             val = None
+        raw_unit = m.group("unit")
+        if raw_unit:
+            unit = _UNIT_LOWER.get(raw_unit) or raw_unit.lower()
+        else:
+            unit = ""
         results.append(
             {
                 "span": m.group(0),
                 "value": val,
-                "unit": (m.group("unit") or "").lower(),
+                "unit": unit,
                 "confidence": "medium" if val is not None else "low",
             }
         )
@@ -3,7 +3,6 @@
 This module provides a standardized data flow from extraction to synthesis.
 """
 
-import json
 import os
 from typing import Any, Dict, Generator
 
@@ -15,6 +14,7 @@ from src.processing.anonymizer import Anonymizer
 from src.processing.conversation_builder import ConversationBuilder
 from src.processing.data_source import DataSource
 from src.processing.external_sorter import ExternalSorter
+from src.processing.pipeline import write_conversations
 
 logger = structlog.get_logger(__name__)
 
@@ -22,6 +22,9 @@ logger = structlog.get_logger(__name__)
 class GeneratorDataSource(DataSource):
     """A DataSource that wraps a generator."""
 
+    # Nothing is known about the order of the wrapped generator
+    ordered_by_date = False
+
     def __init__(self, generator: Generator[Dict[str, Any], None, None]):
         self.generator = generator
 
@@ -45,7 +48,7 @@ class DataSourceStage(DataPipelineStage):
         self.db = db
 
     def process(self, data=None) -> Generator[Dict[str, Any], None, None]:
-        """Read messages from the database."""
+        """Read messages from the database, already ordered by date."""
         logger.info("Reading messages from the database.")
         yield from self.db.get_all_messages()
 
@@ -100,19 +103,9 @@ class PersistenceStage(DataPipelineStage):
         output_file = self.settings.paths.processed_conversations_file
         os.makedirs(self.settings.paths.processed_data_dir, exist_ok=True)
 
-        count = 0
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("[\n")
-            first = True
-            for conv in data_stream:
-                if not first:
-                    f.write(",\n")
-                json.dump(conv, f, ensure_ascii=False)
-                first = False
-                count += 1
-            f.write("\n]\n")
-
-        logger.info(f"Wrote {count} conversations to {output_file}")
+        count = write_conversations(data_stream, output_file)
+
+        logger.info("Conversations written", count=count, path=output_file)
         return count
 
 
@@ -123,13 +116,13 @@ class UnifiedDataPipeline:
         self.settings = settings
         self.db = Database(settings.paths)
         self.anonymizer = Anonymizer(settings.paths)
-        self.sorter = ExternalSorter()
         self.conv_builder = ConversationBuilder(settings.conversation)
 
-        # Create pipeline stages
+        # Create pipeline stages. No SortingStage: the database already returns
+        # messages in date order via idx_messages_date, so re-sorting them
+        # externally would only cost time and temp disk.
         self.stages = [
             DataSourceStage(self.db),
-            SortingStage(self.sorter),
             AnonymizationStage(self.anonymizer),
             ConversationBuildingStage(self.conv_builder),
             PersistenceStage(settings),
@@ -2,18 +2,55 @@
 Memory monitoring utilities for dynamic batch sizing.
 """
 
+import os
 import resource
+import time
+
+import orjson
+
+# How long a memory reading stays fresh, in seconds
+RSS_CACHE_TTL = 0.25
+_STATM_PATH = "/proc/self/statm"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Re-sample the message size estimate every this many messages
+SIZE_SAMPLE_INTERVAL = 1000
+
+# Last reading as (monotonic timestamp, bytes)
+_last_rss = (float("-inf"), 0)
+
+
+def _read_rss():
+    """Read the current resident set size in bytes.
+
+    Uses /proc/self/statm where available (a single small read); elsewhere
+    falls back to getrusage, which only reports the peak RSS.
+    """
+    try:
+        with open(_STATM_PATH, "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_maxrss * 1024  # Convert KB to bytes on Linux
 
 
 def get_memory_usage():
     """
     Get current memory usage in bytes.
 
+    Readings are cached for RSS_CACHE_TTL seconds so callers in hot loops
+    don't hit the OS on every message.
+
     Returns:
         int: Current memory usage in bytes
     """
-    usage = resource.getrusage(resource.RUSAGE_SELF)
-    return usage.ru_maxrss * 1024  # Convert KB to bytes on Linux
+    global _last_rss
+    now = time.monotonic()
+    if now - _last_rss[0] < RSS_CACHE_TTL:
+        return _last_rss[1]
+    rss = _read_rss()
+    _last_rss = (now, rss)
+    return rss
 
 
 def get_memory_usage_mb():
@@ -30,24 +67,23 @@ def estimate_message_size(message_dict):
     """
     Estimate the memory size of a message dictionary.
 
+    Meant to be called on a sample of messages (see SIZE_SAMPLE_INTERVAL)
+    rather than on every message.
+
     Args:
         message_dict (dict): Message dictionary
 
     Returns:
         int: Estimated size in bytes
     """
-    # Rough estimation: sum of string lengths + some overhead
-    size = 0
-    for key, value in message_dict.items():
-        size += len(key) if isinstance(key, str) else 8
-        if isinstance(value, str):
-            size += len(value)
-        elif isinstance(value, (int, float)):
-            size += 8
-        elif isinstance(value, dict):
-            size += len(str(value))  # Rough estimate for nested dicts
-        else:
-            size += len(str(value)) if value else 0
+    # The encoded JSON length is an exact byte count of the payload and far
+    # cheaper than stringifying nested values one by one
+    try:
+        size = len(
+            orjson.dumps(message_dict, default=str, option=orjson.OPT_NON_STR_KEYS)
+        )
+    except TypeError:
+        size = len(str(message_dict))
     # Add some overhead for dictionary structure
     return size + 100
 
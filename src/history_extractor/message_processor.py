@@ -1,6 +1,33 @@
 from typing import Any, Dict, Tuple
 
 
+def _poll_option(option) -> Dict[str, Any]:
+    """Builds the stored dict for one Pyrogram poll option."""
+    option_dict = {
+        "text": getattr(option, "text", ""),
+        "voter_count": getattr(option, "voter_count", 0),
+    }
+    # Pyrogram's PollOption always has "correct" (None outside quizzes)
+    if hasattr(option, "correct"):
+        option_dict["correct"] = option.correct
+    return option_dict
+
+
+def _poll_content(poll) -> Dict[str, Any]:
+    """Builds the stored content dict for a Pyrogram poll."""
+    options = [_poll_option(option) for option in getattr(poll, "options", None) or ()]
+
+    return {
+        "question": getattr(poll, "question", ""),
+        "options": options,
+        "total_voter_count": getattr(poll, "total_voter_count", 0),
+        "is_quiz": getattr(poll, "is_quiz", False),
+        "is_anonymous": getattr(poll, "is_anonymous", True),
+        "close_period": getattr(poll, "close_period", None),
+        "close_date": getattr(poll, "close_date", None),
+    }
+
+
 def get_message_details(msg) -> Tuple[str, Any, Dict[str, Any]]:
     """
     Extracts structured details (type, content, etc.) from a message.
@@ -19,6 +46,10 @@ def get_message_details(msg) -> Tuple[str, Any, Dict[str, Any]]:
         # Extract text content safely
         content = getattr(msg, "text", "") or ""
 
+        # Look up each attribute once; getattr with a default avoids the
+        # raise-and-clear cost hasattr pays on a miss
+        sender_chat = getattr(msg, "sender_chat", None)
+
         # Prepare extra data with common message attributes
         extra_data = {
             "has_protected_content": getattr(msg, "has_protected_content", False),
@@ -27,43 +58,18 @@ def get_message_details(msg) -> Tuple[str, Any, Dict[str, Any]]:
             "forwards": getattr(msg, "forwards", None),
             "message_thread_id": getattr(msg, "message_thread_id", None),
             "sender_chat_id": (
-                getattr(msg.sender_chat, "id", None)
-                if getattr(msg, "sender_chat", None)
-                else None
+                getattr(sender_chat, "id", None) if sender_chat else None
             ),
             "sender_chat_title": (
-                getattr(msg.sender_chat, "title", None)
-                if getattr(msg, "sender_chat", None)
-                else None
+                getattr(sender_chat, "title", None) if sender_chat else None
             ),
         }
 
         # --- Poll Detection for Pyrogram ---
-        if hasattr(msg, "poll") and msg.poll:
+        poll = getattr(msg, "poll", None)
+        if poll:
             try:
-                poll = msg.poll
-
-                # Extract poll options
-                options = []
-                for option in getattr(poll, "options", []):
-                    option_dict = {
-                        "text": getattr(option, "text", ""),
-                        "voter_count": getattr(option, "voter_count", 0),
-                    }
-                    # Add other option attributes if available
-                    if hasattr(option, "correct"):
-                        option_dict["correct"] = getattr(option, "correct", False)
-                    options.append(option_dict)
-
-                poll_content = {
-                    "question": getattr(poll, "question", ""),
-                    "options": options,
-                    "total_voter_count": getattr(poll, "total_voter_count", 0),
-                    "is_quiz": getattr(poll, "is_quiz", False),
-                    "is_anonymous": getattr(poll, "is_anonymous", True),
-                    "close_period": getattr(poll, "close_period", None),
-                    "close_date": getattr(poll, "close_date", None),
-                }
+                poll_content = _poll_content(poll)
 
                 # Add poll-specific data to extra_data
                 extra_data["poll_id"] = getattr(poll, "id", None)
@@ -1,9 +1,108 @@
-import json
 import os
+import threading
+import time
+from collections import namedtuple
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import orjson
 
 from src.core.app import AppContext
+from src.core.serializer import (
+    serialize_content,
+    serialize_date,
+    serialize_extra_data,
+)
+
+# Compact per-message record built by the extractor. Storage fills in the
+# per-batch fields (source name, ingestion time) when buffering.
+MessageRow = namedtuple(
+    "MessageRow",
+    "id date sender_id message_type content extra_data reply_to_msg_id "
+    "topic_id topic_title source_group_id",
+)
+
+# Maximum seconds rows may wait in the buffer before they are committed
+BUFFER_MAX_AGE = 2.0
+
+# ForumTopic attributes kept in the group metadata cache (see save_topics)
+TOPIC_META_FIELDS = (
+    ("message_thread_id", 0),
+    ("name", "General"),
+    ("icon_color", None),
+    ("is_closed", False),
+    ("is_hidden", False),
+    ("is_pinned", False),
+)
+
+
+def _encode_key(key: Any) -> str:
+    """Encode a (group_id, topic_id) key as "group_id:topic_id" for JSON."""
+    if isinstance(key, tuple):
+        return ":".join(str(part) for part in key)
+    return str(key)
+
+
+def _decode_key(key: str) -> Any:
+    """Reverse _encode_key; keys in any other format are returned unchanged."""
+    group_id, sep, topic_id = key.partition(":")
+    if sep:
+        try:
+            return (int(group_id), int(topic_id))
+        except ValueError:
+            pass
+    return key
+
+
+def _db_row(
+    msg: Union[MessageRow, Dict[str, Any]],
+    chat_title: str,
+    topic_id: int,
+    ingestion_ts: str,
+) -> Tuple[Any, ...]:
+    """Build a storage-ready row in the database's MESSAGE_COLUMNS order."""
+    if isinstance(msg, MessageRow):
+        (
+            msg_id,
+            date,
+            sender_id,
+            message_type,
+            content,
+            extra_data,
+            reply_to_msg_id,
+            _,  # The caller's topic_id is authoritative
+            topic_title,
+            source_group_id,
+        ) = msg
+    else:
+        get = msg.get
+        msg_id = get("id")
+        date = get("date")
+        sender_id = get("sender_id")
+        message_type = get("message_type")
+        content = get("content")
+        extra_data = get("extra_data")
+        reply_to_msg_id = get("reply_to_msg_id")
+        topic_title = get("topic_title")
+        # Fall back to group_id when source_group_id is missing
+        source_group_id = get("source_group_id")
+        if source_group_id is None:
+            source_group_id = get("group_id")
+    return (
+        msg_id,
+        source_group_id,
+        topic_id,
+        serialize_date(date),
+        sender_id,
+        message_type,
+        serialize_content(content),
+        serialize_extra_data(extra_data),
+        reply_to_msg_id,
+        topic_title,
+        chat_title,
+        ingestion_ts,
+    )
 
 
 class Storage:
@@ -17,13 +116,25 @@ class Storage:
     def __init__(self, app_context: AppContext):
         self.app_context = app_context
         self.settings = app_context.settings
-        self.message_buffer: List[Dict[str, Any]] = []  # Buffer to accumulate messages
+        # Buffer of storage-ready rows (see _db_row)
+        self.message_buffer: List[Tuple[Any, ...]] = []
         self.buffer_size = (
             self.settings.telegram.extraction.buffer_size
         )  # Use configured buffer size
+        # When the oldest row in message_buffer was added
+        self._buffer_since = 0.0
+        # Last message ID per topic key for the rows in message_buffer; it is
+        # committed together with them, so resume never skips unsaved rows
+        self._pending_cursors: Dict[Tuple[int, int], int] = {}
+        # Batches are written from worker threads (see TelegramExtractor)
+        self._lock = threading.RLock()
 
     def save_messages_to_db(
-        self, chat_title: str, topic_id: int, messages: List[Dict[str, Any]]
+        self,
+        chat_title: str,
+        topic_id: int,
+        messages: List[Union[MessageRow, Dict[str, Any]]],
+        cursor: Optional[Tuple[Tuple[int, int], int]] = None,
     ):
         """
         Saves a list of messages to the database.
@@ -31,40 +142,44 @@ class Storage:
         Args:
             chat_title: The title of the chat the messages are from.
             topic_id: The ID of the topic the messages are from.
-            messages: A list of messages to save.
+            messages: A list of messages to save, as MessageRow tuples or dicts.
+            cursor: Optional (topic key, last message ID) to record as the
+                topic's resume point in the same transaction as the messages.
         """
-        # Add messages to buffer with proper metadata
+        # Serialize straight into row tuples, outside the lock; no
+        # per-message dicts are built between the extractor and the database
         ingestion_ts = datetime.now(timezone.utc).isoformat()
+        rows = [_db_row(msg, chat_title, topic_id, ingestion_ts) for msg in messages]
 
-        # Pre-allocate buffer space if needed
-        needed_space = len(messages)
-        if len(self.message_buffer) + needed_space > self.buffer_size:
-            # Flush current buffer first if adding these messages would exceed buffer size
-            self._flush_buffer()
+        with self._lock:
+            if len(self.message_buffer) + len(rows) > self.buffer_size:
+                # Flush current buffer first if adding these messages would exceed buffer size
+                self._flush_buffer()
 
-        for msg in messages:
-            msg["source_name"] = chat_title
-            # Ensure source_group_id is set correctly
-            if "source_group_id" not in msg or msg["source_group_id"] is None:
-                msg["source_group_id"] = msg.get("source_group_id") or msg.get(
-                    "group_id"
-                )
-            # Fix: Set the correct topic_id field
-            msg["topic_id"] = topic_id
-            msg["source_saved_file"] = None  # No longer saving to individual files
-            msg["ingestion_timestamp"] = ingestion_ts
-            self.message_buffer.append(msg)
-
-        # Save when buffer is full
-        if len(self.message_buffer) >= self.buffer_size:
-            self._flush_buffer()
+            # The buffer is shared by every topic, so concurrent topics'
+            # batches are committed together in one transaction
+            if not self.message_buffer:
+                self._buffer_since = time.monotonic()
+            self.message_buffer.extend(rows)
+            if cursor is not None:
+                key, last_id = cursor
+                self._pending_cursors[key] = last_id
+
+            # Save when buffer is full, or has held rows for BUFFER_MAX_AGE
+            if (
+                len(self.message_buffer) >= self.buffer_size
+                or time.monotonic() - self._buffer_since >= BUFFER_MAX_AGE
+            ):
+                self._flush_buffer()
 
     def _flush_buffer(self):
         """Flush the message buffer to the database."""
-        if self.message_buffer:
-            db = self.app_context.db
-            db.insert_messages(self.message_buffer)
-            self.message_buffer.clear()
+        with self._lock:
+            if self.message_buffer:
+                db = self.app_context.db
+                db.insert_message_rows(self.message_buffer, self._pending_cursors)
+                self.message_buffer.clear()
+                self._pending_cursors.clear()
 
     def save_topics(self, topics: List[Any], source_group_id: int):
         """
@@ -85,30 +200,132 @@ class Storage:
     def clear_buffer(self):
         """Clear the message buffer without flushing to database."""
         self.message_buffer.clear()
+        self._pending_cursors.clear()
 
-    def load_last_msg_ids(self) -> Dict[str, int]:
+    def load_last_msg_ids(self) -> Dict[Tuple[int, int], int]:
         """
-        Loads the last processed message ID for each topic from a file.
+        Loads the last processed message ID for each topic.
+
+        Combines the tracking file with the database cursors, which are
+        committed with the messages themselves and so survive a crash between
+        file saves. The higher ID wins for each topic.
 
         Returns:
-            A dictionary mapping topic keys to the last processed message ID.
+            A dictionary mapping (group_id, topic_id) keys to the last
+            processed message ID.
         """
+        last_msg_ids: Dict[Tuple[int, int], int] = {}
         if os.path.exists(self.settings.paths.tracking_file):
-            with open(self.settings.paths.tracking_file, "r") as f:
+            with open(self.settings.paths.tracking_file, "rb") as f:
                 try:
-                    return json.load(f)
-                except json.JSONDecodeError:
-                    return {}  # Return empty dict if file is corrupted
-        return {}
+                    data = orjson.loads(f.read())
+                except orjson.JSONDecodeError:
+                    data = {}  # Ignore a corrupted file
+            last_msg_ids = {_decode_key(key): value for key, value in data.items()}
+        for key, last_id in self.app_context.db.get_cursors().items():
+            last_msg_ids[key] = max(last_id, last_msg_ids.get(key, 0))
+        return last_msg_ids
 
-    def save_last_msg_ids(self, data: Dict[str, int]):
+    def save_last_msg_ids(self, data: Dict[Tuple[int, int], int]):
         """
         Saves the last processed message ID for each topic to a file.
 
         Args:
-            data: A dictionary mapping topic keys to the last processed message ID.
+            data: A dictionary mapping (group_id, topic_id) keys to the last
+                processed message ID.
         """
-        # Flush any remaining messages before saving progress
-        self._flush_buffer()
-        with open(self.settings.paths.tracking_file, "w") as f:
-            json.dump(data, f, indent=2)
+        encoded = {_encode_key(key): value for key, value in data.items()}
+        data_bytes = orjson.dumps(encoded, option=orjson.OPT_INDENT_2)
+        with self._lock:
+            # Flush any remaining messages before saving progress
+            self._flush_buffer()
+            self._replace_file(self.settings.paths.tracking_file, data_bytes)
+
+    @staticmethod
+    def _replace_file(path: str, data_bytes: bytes):
+        """Write to a temp file and rename it over path, so a crash mid-write
+        never leaves a torn file behind."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data_bytes)
+        os.replace(tmp_path, path)
+
+    def _load_group_meta(self) -> Dict[str, Any]:
+        """Reads the group metadata cache file, or {} if missing or corrupted."""
+        path = self.settings.paths.group_meta_file
+        if not os.path.exists(path):
+            return {}
+        with open(path, "rb") as f:
+            try:
+                return orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                return {}
+
+    def get_group_meta(self, group_id: int) -> Optional[Tuple[Any, List[Any]]]:
+        """
+        Returns the cached entity and topics of a group, if still fresh.
+
+        The cached objects carry only the attributes the extractor reads, so
+        a fresh entry saves the get_chat and get_forum_topics round-trips.
+
+        Args:
+            group_id: The ID of the group.
+
+        Returns:
+            An (entity, topics) tuple, or None if the group is not cached or
+            its entry is older than the configured group_meta_ttl.
+        """
+        with self._lock:
+            entry = self._load_group_meta().get(str(group_id))
+        ttl = self.settings.telegram.extraction.group_meta_ttl
+        if not entry or time.time() - entry.get("cached_at", 0) >= ttl:
+            return None
+        entity = SimpleNamespace(
+            id=group_id, title=entry.get("title"), is_forum=entry.get("is_forum")
+        )
+        topics = [SimpleNamespace(**topic) for topic in entry.get("topics", ())]
+        return entity, topics
+
+    def save_group_meta(self, group_id: int, entity: Any, topics: List[Any]):
+        """
+        Caches the entity and topics of a group for get_group_meta.
+
+        Args:
+            group_id: The ID of the group.
+            entity: The group entity returned by get_chat.
+            topics: The forum topics of the group, empty for regular groups.
+        """
+        entry = {
+            "title": getattr(entity, "title", None),
+            "is_forum": bool(getattr(entity, "is_forum", False)),
+            "topics": [
+                {
+                    name: getattr(topic, name, default)
+                    for name, default in TOPIC_META_FIELDS
+                }
+                for topic in topics
+            ],
+            "cached_at": time.time(),
+        }
+        with self._lock:
+            meta = self._load_group_meta()
+            meta[str(group_id)] = entry
+            self._replace_file(
+                self.settings.paths.group_meta_file,
+                orjson.dumps(meta, default=str, option=orjson.OPT_INDENT_2),
+            )
+
+    def invalidate_group_meta(self, group_id: int):
+        """
+        Drops a group's cached metadata, so the next run fetches it again.
+
+        Args:
+            group_id: The ID of the group.
+        """
+        with self._lock:
+            meta = self._load_group_meta()
+            if meta.pop(str(group_id), None) is not None:
+                self._replace_file(
+                    self.settings.paths.group_meta_file,
+                    orjson.dumps(meta, option=orjson.OPT_INDENT_2),
+                )
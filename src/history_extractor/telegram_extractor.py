@@ -1,7 +1,7 @@
 import asyncio
-import time
-from datetime import datetime
-from typing import Any, Dict, Tuple
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import structlog
 from pyrogram import Client
@@ -13,23 +13,40 @@ from src.core.error_handler import (
     retry_with_backoff,
 )
 from src.history_extractor.memory_utils import (
+    SIZE_SAMPLE_INTERVAL,
     calculate_dynamic_batch_size,
     estimate_message_size,
     get_memory_usage_mb,
 )
 from src.history_extractor.message_processor import get_message_details
-from src.history_extractor.storage import Storage
+from src.history_extractor.storage import MessageRow, Storage
 from src.history_extractor.utils import normalize_title
 
 logger = structlog.get_logger(__name__)
 
+# FloodWaits a topic, or a whole extract_from_group_id call, absorbs before
+# re-raising
+FLOOD_WAIT_MAX_RETRIES = 5
+
+# Shortest pause, in seconds, between progress line refreshes
+MIN_UI_UPDATE_INTERVAL = 1
+
 
 class GeneralTopic:
-    """A mock topic object for regular groups that are not forums."""
+    """A stand-in topic for regular groups that are not forums.
+
+    Exposes the same attributes extract_from_topic reads from a Pyrogram
+    ForumTopic. It is stateless, so a single shared instance is used.
+    """
+
+    __slots__ = ()
+    id = 0
+    message_thread_id = 0
+    title = "General"
+    name = "General"
 
-    def __init__(self):
-        self.id = 0
-        self.title = "General"
+
+GENERAL_TOPIC = GeneralTopic()
 
 
 class TelegramExtractor:
@@ -72,12 +89,108 @@ class TelegramExtractor:
         else:
             self.metrics = metrics
 
+        # One dedicated writer thread: SQLite takes a single writer anyway, and
+        # queued flushes never wait behind unrelated default-executor work
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="db-writer"
+        )
+
+    async def _run_db(self, func: Callable, *args: Any) -> Any:
+        """Runs a blocking storage call on the extractor's database thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._db_executor, func, *args
+        )
+
+    async def aclose(self):
+        """Waits for queued storage calls and shuts down the database thread."""
+        await asyncio.to_thread(self._db_executor.shutdown)
+
+    async def _save_chunk(
+        self,
+        full_title: str,
+        topic_id: int,
+        batch: list,
+        last_msg_ids: Dict[Tuple[int, int], int],
+        last_id_key: Tuple[int, int],
+        max_id: int,
+    ):
+        """
+        Writes one batch off the event loop and records the topic's progress.
+
+        The topic's cursor is committed in the same database transaction as
+        the batch, so a restart after a crash resumes from the last saved row.
+
+        Args:
+            full_title: The "<group>_<topic>" title to store with the messages.
+            topic_id: The ID of the topic the messages are from.
+            batch: The messages to save.
+            last_msg_ids: A dictionary mapping topic keys to the last processed message ID.
+            last_id_key: The key of this topic in last_msg_ids.
+            max_id: The highest message ID saved so far for this topic.
+        """
+        await self._run_db(
+            self.storage.save_messages_to_db,
+            full_title,
+            topic_id,
+            batch,
+            (last_id_key, max_id),
+        )
+        # A single dict store can't interleave with other coroutines, so it
+        # needs no lock; last_msg_ids_lock only guards whole-dict snapshots
+        last_msg_ids[last_id_key] = max_id
+
+    async def _save_progress(
+        self, last_msg_ids: Dict[Tuple[int, int], int], last_msg_ids_lock=None
+    ):
+        """
+        Writes a snapshot of last_msg_ids to the tracking file off the event loop.
+
+        Args:
+            last_msg_ids: A dictionary mapping topic keys to the last processed message ID.
+            last_msg_ids_lock: Optional lock guarding last_msg_ids.
+        """
+        if last_msg_ids_lock:
+            async with last_msg_ids_lock:
+                snapshot = dict(last_msg_ids)
+        else:
+            snapshot = dict(last_msg_ids)
+        await self._run_db(self.storage.save_last_msg_ids, snapshot)
+
+    async def _produce_messages(
+        self, chat_history: Any, topic_id: int, queue: asyncio.Queue
+    ):
+        """
+        Feeds a topic's messages from a chat history iterator into a queue.
+
+        Messages from other topics and service messages are dropped here. A
+        None sentinel is queued once the history is exhausted or fails.
+
+        Args:
+            chat_history: The async iterator returned by get_chat_history.
+            topic_id: The topic to keep messages for (0 for the general topic).
+            queue: The queue the consumer reads from.
+        """
+        try:
+            async for msg in chat_history:
+                # Keep only this topic's messages (thread ID 0/None is the
+                # general topic) and skip service messages. Pyrogram's Message
+                # always defines both attributes, so no getattr fallback.
+                if (msg.message_thread_id or 0) != topic_id or msg.service:
+                    continue
+                await queue.put(msg)
+        except Exception:
+            # Wake the consumer so it stops and surfaces the error
+            await queue.put(None)
+            raise
+        await queue.put(None)
+
     async def extract_from_topic(
         self,
         entity: Any,
         topic: Any,
         last_msg_ids: Dict[Tuple[int, int], int],
         last_msg_ids_lock=None,
+        topic_title: Optional[str] = None,
     ) -> int:
         """
         Extracts all new messages from a specific group topic or regular group.
@@ -86,211 +199,226 @@ class TelegramExtractor:
             entity: The entity to extract messages from.
             topic: The topic to extract messages from (for forums) or a mock topic object with id=0 for regular groups.
             last_msg_ids: A dictionary mapping topic keys to the last processed message ID.
+            last_msg_ids_lock: Optional lock guarding last_msg_ids.
+            topic_title: The topic's normalized title, if the caller already has it.
 
         Returns:
             The number of messages extracted.
         """
         group_id = entity.id
         topic_id = topic.message_thread_id
-        topic_title = normalize_title(getattr(topic, "name", "General"))
+        if topic_title is None:
+            topic_title = normalize_title(getattr(topic, "name", "General"))
         last_id_key = (group_id, topic_id)
         last_id = last_msg_ids.get(last_id_key, 0)
-        max_id = 0
-
-        # Start timing the extraction process
-        start_time = time.time()
-        start_time_dt = datetime.now()
+        full_title = f"{entity.title}_{topic_title}"
+        # Settings read in the message loop, looked up once per topic
+        extraction = self.settings.telegram.extraction
+        progress_update_messages = extraction.progress_update_messages
+        # The validator only warns below 1 second; a zero or negative interval
+        # would turn the progress timer into a busy loop
+        ui_update_interval = max(extraction.ui_update_interval, MIN_UI_UPDATE_INTERVAL)
+
+        # Timing uses the loop's monotonic clock
+        loop = asyncio.get_running_loop()
+        start_mono = loop.time()
 
         # Initialize variables at the start of the method
         message_size_estimate = 0  # Initialize with default value
-        batch_size = (
-            self.settings.telegram.extraction.batch_size
-        )  # Use configurable batch size
+        batch_size = extraction.batch_size  # Use configurable batch size
         message_batch = []
+        # Approximate payload of message_batch, so batches of large messages
+        # are flushed before they reach batch_size
+        batch_bytes = 0
+        max_batch_bytes = extraction.max_batch_bytes
+        pending_save = None  # Background write of the previous batch
         total_saved = 0
         processed_count = 0
         saved_count = 0
         max_id = 0
-        last_update_time_dt = start_time_dt  # Initialize with start time
 
         logger.info(
             f"  - 📥 Extracting from topic: '{topic_title}' (ID: {topic_id}) [Since message ID > {last_id}]"
         )
 
+        # min_id makes the server return only messages newer than the last
+        # saved one, and reverse=True yields them oldest first, so every
+        # checkpointed max_id covers all messages before it
         chat_history = self.client.get_chat_history(
-            entity.id if hasattr(entity, "id") else entity, offset_id=last_id
+            group_id,
+            min_id=last_id,
+            reverse=True,
         )
         if chat_history is not None:
-            async for msg in chat_history:
-                # For topics, filter by message_thread_id
-                msg_thread_id = getattr(msg, "message_thread_id", 0) or 0
-                if topic_id == 0:
-                    # For general topic, include messages with no thread ID (general messages)
-                    if msg_thread_id != 0:
-                        continue
-                else:
-                    # For specific topics, only include messages with matching thread ID
-                    if msg_thread_id != topic_id:
-                        continue
-                # Skip service messages
-                if getattr(msg, "service", False):
-                    continue
-                # Skip messages without text or media
-                if not getattr(msg, "text", None) and not getattr(msg, "media", None):
-                    processed_count += 1
-                    # Update progress display every N messages or every M seconds (based on config)
-                    current_time = datetime.now()
-                    elapsed_since_last_update = (
-                        current_time - last_update_time_dt
-                    ).total_seconds()
-                    if (
-                        processed_count
-                        % self.settings.telegram.extraction.progress_update_messages
-                        == 0
-                        or elapsed_since_last_update
-                        > self.settings.telegram.extraction.ui_update_interval
-                    ):
-                        elapsed_total = (current_time - start_time_dt).total_seconds()
-                        speed = (
-                            processed_count / elapsed_total if elapsed_total > 0 else 0
-                        )
-                        memory_usage = get_memory_usage_mb()
-                        # Use \r to overwrite the same line
-                        print(
-                            f"\r    💬 {topic_title:<20} | "
-                            f"Messages: {processed_count:>6} | "
-                            f"Saved: {saved_count:>6} | "
-                            f"Speed: {speed:>5.1f} msg/sec | "
-                            f"Memory: {memory_usage:>6.1f}MB",
-                            end="",
-                            flush=True,
-                        )
-                        last_update_time_dt = current_time
-                    continue
-
-                try:
-                    message_type, content, extra_data = get_message_details(msg)
-                except Exception as e:
-                    logger.warning(f"Failed to process message {msg.id}: {e}")
-                    processed_count += 1
-                    continue
-
-                if not content:
-                    processed_count += 1
-                    continue
-
-                # Get sender information
-                sender_id = None
-                if hasattr(msg, "from_user") and msg.from_user:
-                    sender_id = msg.from_user.id
-                elif hasattr(msg, "sender_chat") and msg.sender_chat:
-                    sender_id = msg.sender_chat.id
-
-                message_dict = {
-                    "id": msg.id,
-                    "date": (
-                        msg.date.isoformat()
-                        if isinstance(msg.date, datetime)
-                        else datetime.fromtimestamp(msg.date).isoformat()
-                    ),
-                    "sender_id": sender_id,
-                    "message_type": message_type,
-                    "content": content,
-                    "extra_data": extra_data,
-                    "reply_to_msg_id": getattr(msg, "reply_to_message_id", None),
-                    "topic_id": topic_id,
-                    "topic_title": topic_title,
-                    "source_name": (
-                        entity.title if hasattr(entity, "title") else str(entity)
-                    ),
-                    "source_group_id": entity.id if hasattr(entity, "id") else group_id,
-                    "ingestion_timestamp": datetime.now().isoformat(),
-                }
-
-                # Estimate message size for dynamic batch sizing
-                if processed_count == 1:  # Estimate size from first message
-                    message_size_estimate = estimate_message_size(message_dict)
-                    # Adjust batch size based on available memory
-                    batch_size = calculate_dynamic_batch_size(
-                        self.settings.telegram.extraction.batch_size,
-                        message_size_estimate,
-                    )
+            # Page through the history in a producer task, so the next page is
+            # requested while this coroutine processes the current one. The
+            # bounded queue applies backpressure if processing falls behind.
+            queue: asyncio.Queue = asyncio.Queue(maxsize=2 * batch_size)
+            producer = asyncio.create_task(
+                self._produce_messages(chat_history, topic_id, queue)
+            )
 
-                message_batch.append(message_dict)
-                max_id = max(max_id, msg.id)
-                processed_count += 1
-                saved_count += 1
-
-                # Update progress display every N messages or every M seconds (based on config)
-                current_time = datetime.now()
-                elapsed_since_last_update = (
-                    current_time - last_update_time_dt
-                ).total_seconds()
-                if (
-                    processed_count
-                    % self.settings.telegram.extraction.progress_update_messages
-                    == 0
-                    or elapsed_since_last_update
-                    > self.settings.telegram.extraction.ui_update_interval
-                ):
-                    elapsed_total = (current_time - start_time_dt).total_seconds()
+            async def report_progress():
+                # Report progress on a timer rather than from the message
+                # loop. Topics run concurrently, so each one logs its own line
+                # instead of rewriting a shared terminal line.
+                while True:
+                    await asyncio.sleep(ui_update_interval)
+                    elapsed_total = loop.time() - start_mono
                     speed = processed_count / elapsed_total if elapsed_total > 0 else 0
-                    memory_usage = get_memory_usage_mb()
-                    # Use \r to overwrite the same line
-                    print(
-                        f"\r    💬 {topic_title:<20} | "
-                        f"Messages: {processed_count:>6} | "
-                        f"Saved: {saved_count:>6} | "
-                        f"Speed: {speed:>5.1f} msg/sec | "
-                        f"Memory: {memory_usage:>6.1f}MB",
-                        end="",
-                        flush=True,
+                    logger.info(
+                        "Topic progress",
+                        topic=topic_title,
+                        messages=processed_count,
+                        saved=saved_count,
+                        msg_per_sec=round(speed, 1),
+                        memory_mb=round(get_memory_usage_mb(), 1),
                     )
-                    last_update_time_dt = current_time
-
-                # When batch is full, save to database
-                if len(message_batch) >= batch_size:
-                    if message_batch:
-                        full_title = f"{entity.title}_{topic_title}"
-                        self.storage.save_messages_to_db(
-                            full_title, topic_id, message_batch
-                        )
-                        total_saved += len(message_batch)
-                        self.metrics.record_messages(len(message_batch))
-                        message_batch = []  # Clear the batch
 
-                        # Log metrics periodically
-                        if (
-                            total_saved
-                            % (
-                                self.settings.telegram.extraction.progress_update_messages
-                                * 5
+            reporter = asyncio.create_task(report_progress())
+            # A bound method as a local skips an attribute lookup per message
+            next_message = queue.get
+            try:
+                try:
+                    while (msg := await next_message()) is not None:
+                        # Only text and polls yield content (see get_message_details),
+                        # so skip everything else before parsing it. Pyrogram's
+                        # Message defines every attribute read below.
+                        if not (msg.text or msg.poll):
+                            processed_count += 1
+                            continue
+
+                        try:
+                            message_type, content, extra_data = get_message_details(msg)
+                        except Exception as e:
+                            # Key-value fields leave formatting to the handler
+                            logger.warning(
+                                "Failed to process message",
+                                message_id=msg.id,
+                                error=str(e),
                             )
-                            == 0
-                        ):
-                            self.metrics.log_summary()
+                            processed_count += 1
+                            continue
+
+                        if not content:
+                            processed_count += 1
+                            continue
+
+                        # Get sender information
+                        sender = msg.from_user or msg.sender_chat
+                        sender_id = sender.id if sender else None
+
+                        # A namedtuple is built in one call and is much smaller than a
+                        # dict; Storage adds source name and ingestion time per batch
+                        # Pyrogram always parses Message.date into a datetime
+                        message_row = MessageRow(
+                            id=msg.id,
+                            date=msg.date.isoformat(),
+                            sender_id=sender_id,
+                            message_type=message_type,
+                            content=content,
+                            extra_data=extra_data,
+                            reply_to_msg_id=msg.reply_to_message_id,
+                            topic_id=topic_id,
+                            topic_title=topic_title,
+                            source_group_id=group_id,
+                        )
 
-                        # Re-estimate batch size after each batch to adapt to changing conditions
-                        if processed_count > 1:
+                        # Estimate message size for dynamic batch sizing from a sample,
+                        # re-sampling periodically to follow drift in message shape
+                        if processed_count % SIZE_SAMPLE_INTERVAL == 1:
+                            message_size_estimate = estimate_message_size(
+                                message_row._asdict()
+                            )
+                            # Adjust batch size based on available memory
                             batch_size = calculate_dynamic_batch_size(
-                                self.settings.telegram.extraction.batch_size,
+                                extraction.batch_size,
                                 message_size_estimate,
                             )
 
+                        message_batch.append(message_row)
+                        # Text dominates a message's size; other content (polls)
+                        # is counted with the sampled per-message estimate
+                        batch_bytes += (
+                            len(content)
+                            if isinstance(content, str)
+                            else message_size_estimate
+                        )
+                        processed_count += 1
+                        saved_count += 1
+
+                        # When batch is full (by count or by payload size), hand it
+                        # to a background write so the next page is fetched while
+                        # the database commits
+                        if (
+                            len(message_batch) >= batch_size
+                            or batch_bytes >= max_batch_bytes
+                        ):
+                            if message_batch:
+                                # Ids arrive ascending, so the batch ends on its max
+                                max_id = message_batch[-1].id
+                                if pending_save is not None:
+                                    await pending_save
+                                pending_save = asyncio.create_task(
+                                    self._save_chunk(
+                                        full_title,
+                                        topic_id,
+                                        message_batch,
+                                        last_msg_ids,
+                                        last_id_key,
+                                        max_id,
+                                    )
+                                )
+                                total_saved += len(message_batch)
+                                self.metrics.record_messages(len(message_batch))
+                                message_batch = []  # Clear the batch
+                                batch_bytes = 0
+
+                                # Log metrics periodically
+                                if total_saved % (progress_update_messages * 5) == 0:
+                                    self.metrics.log_summary()
+
+                                # Re-estimate batch size after each batch to adapt to changing conditions
+                                if processed_count > 1:
+                                    batch_size = calculate_dynamic_batch_size(
+                                        extraction.batch_size,
+                                        message_size_estimate,
+                                    )
+                except BaseException:
+                    producer.cancel()
+                    raise
+                finally:
+                    reporter.cancel()
+                # Re-raise any error hit while paging the history
+                await producer
+            finally:
+                # Even when paging fails, let the previous batch's write finish
+                # (and surface its errors) before returning, so a retry resumes
+                # from the cursor it committed. The unsaved batch is re-fetched.
+                if pending_save is not None:
+                    await pending_save
+
         # Save any remaining messages in the batch
         if message_batch:
-            full_title = f"{entity.title}_{topic_title}"
-            self.storage.save_messages_to_db(full_title, topic_id, message_batch)
+            max_id = message_batch[-1].id
+            if pending_save is not None:
+                await pending_save
+            pending_save = asyncio.create_task(
+                self._save_chunk(
+                    full_title,
+                    topic_id,
+                    message_batch,
+                    last_msg_ids,
+                    last_id_key,
+                    max_id,
+                )
+            )
             total_saved += len(message_batch)
             self.metrics.record_messages(len(message_batch))
-
-        # Update last message ID with thread-safe access
-        if total_saved > 0 and max_id > 0:
-            if last_msg_ids_lock:
-                async with last_msg_ids_lock:
-                    last_msg_ids[last_id_key] = max_id
-            else:
-                last_msg_ids[last_id_key] = max_id
+        if pending_save is not None:
+            await pending_save
+            # Checkpoints are debounced, so always persist a finished topic
+            await self._save_progress(last_msg_ids, last_msg_ids_lock)
 
         # Log final metrics
         if total_saved > 0:
@@ -298,18 +426,18 @@ class TelegramExtractor:
 
         # Display final extraction information on a new line
         if processed_count > 0:
-            elapsed_total = (datetime.now() - start_time_dt).total_seconds()
+            elapsed_total = loop.time() - start_mono
             speed = processed_count / elapsed_total if elapsed_total > 0 else 0
             memory_usage = get_memory_usage_mb()
             print(
-                f"\r    ✅ {topic_title:<20} | "
+                f"    ✅ {topic_title:<20} | "
                 f"Messages: {processed_count:>6} | "
                 f"Saved: {total_saved:>6} | "
                 f"Speed: {speed:>5.1f} msg/sec | "
                 f"Memory: {memory_usage:>6.1f}MB"
             )
 
-            extraction_time = time.time() - start_time
+            extraction_time = elapsed_total
             extraction_speed = (
                 processed_count / extraction_time if extraction_time > 0 else 0
             )
@@ -329,6 +457,98 @@ class TelegramExtractor:
 
         return total_saved
 
+    async def _sleep_with_heartbeat(self, wait_time: float, interval: float = 30):
+        """
+        Sleeps for wait_time in one call, logging the time left every interval.
+
+        Args:
+            wait_time: The number of seconds to sleep.
+            interval: Seconds between "Waiting for ..." messages.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_time
+
+        async def heartbeat():
+            while True:
+                logger.info(f"Waiting for {deadline - loop.time():.0f} more seconds...")
+                await asyncio.sleep(interval)
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        try:
+            await asyncio.sleep(wait_time)
+        finally:
+            heartbeat_task.cancel()
+
+    async def _wait_out_flood(
+        self,
+        fwe: FloodWait,
+        attempt: int,
+        source: str,
+        last_msg_ids: Dict[Tuple[int, int], int],
+        last_msg_ids_lock=None,
+    ):
+        """
+        Waits out a FloodWait, with jitter, after persisting progress.
+
+        Args:
+            fwe: The FloodWait raised by the API.
+            attempt: How many FloodWaits the caller has hit so far, from 1.
+            source: What was throttled, for the log message.
+            last_msg_ids: A dictionary mapping topic keys to the last processed message ID.
+            last_msg_ids_lock: Optional lock guarding last_msg_ids.
+        """
+        # Jitter (growing with each retry) keeps concurrent callers from all
+        # retrying at the same instant
+        wait_time = fwe.value + random.uniform(0, min(2**attempt, 30))
+        logger.warning(
+            f"Flood wait error for {source}. Waiting for {wait_time:.0f} seconds."
+        )
+        self.metrics.record_error("FloodWait")
+        # Persist progress first, so a crash mid-wait doesn't re-download
+        await self._save_progress(last_msg_ids, last_msg_ids_lock)
+        await self._sleep_with_heartbeat(wait_time)
+
+    async def _fetch_topics(
+        self,
+        group_id: int,
+        entity: Any,
+        on_topic: Optional[Callable[[Any], None]] = None,
+    ) -> List[Any]:
+        """
+        Fetches a group's forum topics, saving them and caching the group metadata.
+
+        Args:
+            group_id: The ID of the group.
+            entity: The group entity.
+            on_topic: Optional callback invoked with each topic as it is listed,
+                so work on it can start before the listing finishes.
+
+        Returns:
+            The group's forum topics, or an empty list for regular groups.
+        """
+        # Try to get forum topics. This is now much simpler with the new library.
+        topics = []
+        try:
+            async for topic in self.client.get_forum_topics(entity.id):
+                topics.append(topic)
+                if on_topic is not None:
+                    on_topic(topic)
+        except Exception as e:
+            logger.warning(
+                f"Could not fetch topics for group {entity.id}. "
+                f"This might be a regular group or an error occurred: {e}"
+            )
+            # A failure is expected for regular groups; for a forum it may be
+            # transient, so don't cache an empty topic list
+            if getattr(entity, "is_forum", False):
+                return topics
+
+        if topics:
+            # Keep the event loop free while SQLite writes the topics
+            await self._run_db(self.storage.save_topics, topics, group_id)
+        await self._run_db(self.storage.save_group_meta, group_id, entity, topics)
+        return topics
+
     @retry_with_backoff(max_retries=3, initial_wait=5.0, backoff_factor=2.0)
     @handle_critical_errors(default_alert_manager)
     async def extract_from_group_id(
@@ -350,80 +570,126 @@ class TelegramExtractor:
             The total number of messages extracted from the group.
         """
         total_messages = 0
-        try:
-            # Use pre-fetched entity if provided, otherwise fetch it
-            if entity is None:
-                entity = await self.client.get_chat(group_id)
-            logger.info(f"\nProcessing Group: {entity.title} (ID: {group_id})")
-
-            # Try to get forum topics. This is now much simpler with the new library.
-            topics = []
+        flood_waits = 0
+        # Retry FloodWaits in a loop rather than by recursion, so long flood
+        # storms neither grow the stack nor drop the fetched entity
+        while True:
             try:
-                async for topic in self.client.get_forum_topics(entity.id):
-                    topics.append(topic)
-            except Exception as e:
-                logger.warning(
-                    f"Could not fetch topics for group {entity.id}. "
-                    f"This might be a regular group or an error occurred: {e}"
+                # Extract topics concurrently; the semaphore bounds how many
+                # histories are paged at once to stay within rate limits
+                semaphore = asyncio.Semaphore(
+                    self.settings.telegram.extraction.concurrent_topics
                 )
+                tasks = []
+
+                async def extract_topic(i, topic, topic_title):
+                    logger.info(f"📊 Processing topic {i}: '{topic_title}'")
+                    flood_waits = 0
+                    while True:
+                        async with semaphore:
+                            try:
+                                return await self.extract_from_topic(
+                                    entity,
+                                    topic,
+                                    last_msg_ids,
+                                    last_msg_ids_lock,
+                                    topic_title,
+                                )
+                            except FloodWait as fwe:
+                                # Retry this topic only; its checkpoints let
+                                # the retry resume where it was. Past the cap,
+                                # the group-level handler takes over.
+                                flood_waits += 1
+                                if flood_waits > FLOOD_WAIT_MAX_RETRIES:
+                                    raise
+                                flood_wait = fwe
+                        # Wait outside the semaphore, so the slot is free for
+                        # other topics meanwhile
+                        await self._wait_out_flood(
+                            flood_wait,
+                            flood_waits,
+                            f"topic '{topic_title}'",
+                            last_msg_ids,
+                            last_msg_ids_lock,
+                        )
 
-            if topics:
-                self.storage.save_topics(topics, group_id)
-                logger.info(f"📋 Found {len(topics)} topics:")
-
-                # Display topic list upfront
-                for i, topic in enumerate(topics, 1):
+                def start_topic(topic):
+                    # Normalize each title once, for the list and the extraction
                     topic_title = normalize_title(getattr(topic, "name", "General"))
+                    i = len(tasks) + 1
                     logger.info(f"  {i:2d}. {topic_title}")
-
-                logger.info(f"🔄 Starting extraction of {len(topics)} topics...")
-
-                # Process topics with progress tracking
-                for i, topic in enumerate(topics, 1):
-                    topic_title = normalize_title(getattr(topic, "name", "General"))
-                    logger.info(
-                        f"📊 Processing topic {i}/{len(topics)}: '{topic_title}'"
-                    )
-                    count = await self.extract_from_topic(
-                        entity, topic, last_msg_ids, last_msg_ids_lock
-                    )
-                    total_messages += count
-            else:
-                # Check if it's marked as a forum but has no topics, or if it's a regular group
-                is_forum = getattr(entity, "is_forum", False)
-                if is_forum:
-                    logger.info("  - Forum group with no topics found. Skipping.")
-                else:
-                    logger.info(
-                        "  - This is a regular group. Extracting from main chat."
+                    tasks.append(
+                        asyncio.create_task(extract_topic(i, topic, topic_title))
                     )
 
-                    # Create a proper GeneralTopic object instead of using type() hack
-                    general_topic = GeneralTopic()
-                    count = await self.extract_from_topic(
-                        entity, general_topic, last_msg_ids, last_msg_ids_lock
-                    )
-                    total_messages += count
-        except FloodWait as fwe:
-            logger.warning(
-                f"Flood wait error for group {group_id}. Waiting for {fwe.value} seconds."
-            )
-            self.metrics.record_error("FloodWait")
-            # Show a message every 30 seconds while waiting
-            wait_time = fwe.value
-            while wait_time > 0:
-                if wait_time % 30 == 0 or wait_time < 30:
-                    logger.info(f"Waiting for {wait_time} more seconds...")
-                await asyncio.sleep(min(30, wait_time))
-                wait_time -= 30
-            # Retry after flood wait
-            total_messages = await self.extract_from_group_id(
-                group_id, last_msg_ids, entity, last_msg_ids_lock
-            )
-        except Exception as e:
-            logger.exception(f"❌ Error processing group {group_id}: {e}")
-            self.metrics.record_error("GeneralException")
-            # The function already has retry decorator, so just re-raise to trigger it
-            raise
+                try:
+                    # Reuse the entity and topics from a recent run when cached
+                    cached = await self._run_db(self.storage.get_group_meta, group_id)
+                    if cached is not None:
+                        cached_entity, topics = cached
+                        if entity is None:
+                            entity = cached_entity
+                        logger.info(
+                            f"\nProcessing Group: {entity.title} (ID: {group_id}) "
+                            "using cached topics"
+                        )
+                        for topic in topics:
+                            start_topic(topic)
+                    else:
+                        # Use pre-fetched entity if provided, otherwise fetch it
+                        if entity is None:
+                            entity = await self.client.get_chat(group_id)
+                        logger.info(
+                            f"\nProcessing Group: {entity.title} (ID: {group_id})"
+                        )
+                        # Each topic's extraction starts as soon as it is listed,
+                        # rather than after the whole listing has been paged
+                        await self._fetch_topics(group_id, entity, start_topic)
+                except BaseException:
+                    # Don't leave topics extracting behind a retry or failure
+                    for task in tasks:
+                        task.cancel()
+                    raise
+
+                if tasks:
+                    logger.info(f"🔄 Extracting {len(tasks)} topics...")
+                    results = await asyncio.gather(*tasks, return_exceptions=True)
+                    # Let every topic finish before surfacing the first failure
+                    for result in results:
+                        if isinstance(result, BaseException):
+                            raise result
+                    total_messages += sum(results)
+                else:
+                    # Check if it's marked as a forum but has no topics, or if it's a regular group
+                    is_forum = getattr(entity, "is_forum", False)
+                    if is_forum:
+                        logger.info("  - Forum group with no topics found. Skipping.")
+                    else:
+                        logger.info(
+                            "  - This is a regular group. Extracting from main chat."
+                        )
 
-        return total_messages
+                        count = await self.extract_from_topic(
+                            entity, GENERAL_TOPIC, last_msg_ids, last_msg_ids_lock
+                        )
+                        total_messages += count
+                return total_messages
+            except FloodWait as fwe:
+                flood_waits += 1
+                if flood_waits > FLOOD_WAIT_MAX_RETRIES:
+                    raise
+                # Same policy as the per-topic retries in extract_topic
+                await self._wait_out_flood(
+                    fwe,
+                    flood_waits,
+                    f"group {group_id}",
+                    last_msg_ids,
+                    last_msg_ids_lock,
+                )
+            except Exception as e:
+                logger.exception(f"❌ Error processing group {group_id}: {e}")
+                self.metrics.record_error("GeneralException")
+                # The group may have gone private or lost topics; refetch next time
+                await self._run_db(self.storage.invalidate_group_meta, group_id)
+                # The function already has retry decorator, so just re-raise to trigger it
+                raise
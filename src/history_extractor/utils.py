@@ -1,6 +1,14 @@
 import re
+import string
 from typing import Any
 
+# Characters outside [a-zA-Z0-9_-] are replaced with "_"
+_UNSAFE_FILENAME_RE = re.compile(r"[^a-zA-Z0-9_\-]")
+_SAFE_FILENAME_CHARS = set(string.ascii_letters + string.digits + "_-")
+_ASCII_FILENAME_TABLE = str.maketrans(
+    {chr(c): "_" for c in range(128) if chr(c) not in _SAFE_FILENAME_CHARS}
+)
+
 
 def safe_filename(s: str) -> str:
     """
@@ -12,7 +20,11 @@ def safe_filename(s: str) -> str:
     Returns:
         The sanitized string.
     """
-    return re.sub(r"[^a-zA-Z0-9_\-]", "_", s)
+    # translate is a single table lookup per character, but its table only
+    # covers ASCII; anything wider goes through the precompiled regex
+    if s.isascii():
+        return s.translate(_ASCII_FILENAME_TABLE)
+    return _UNSAFE_FILENAME_RE.sub("_", s)
 
 
 def normalize_title(title: Any) -> str:
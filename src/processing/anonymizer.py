@@ -5,10 +5,10 @@ This module provides a class for managing a persistent map of user IDs to
 anonymized identifiers.
 """
 
-import json
 import os
 from typing import Dict, Tuple
 
+import orjson
 import structlog
 
 from src.core.config import PathSettings
@@ -31,43 +31,58 @@ class Anonymizer:
         self.user_map, self.next_user_num = self._load_user_map()
 
     def _load_user_map(self) -> Tuple[Dict[str, str], int]:
-        """Loads the user map from disk if it exists."""
+        """Loads the user map and the next user number from disk if it exists."""
         if os.path.exists(self.user_map_file):
             try:
-                with open(self.user_map_file, "r", encoding="utf-8") as f:
-                    m = json.load(f)
-                max_n = 0
-                for v in m.values():
-                    if isinstance(v, str) and v.startswith("User_"):
-                        try:
-                            n = int(v.split("_", 1)[1])
-                            if n > max_n:
-                                max_n = n
-                        except (ValueError, IndexError):
-                            pass
-                return m, max_n + 1
-            except (json.JSONDecodeError, IOError) as e:
+                with open(self.user_map_file, "rb") as f:
+                    data = orjson.loads(f.read())
+                if "map" in data and "next" in data:
+                    return data["map"], data["next"]
+                # Older files hold only the map; recover the counter from it
+                return data, self._next_user_num(data)
+            except (orjson.JSONDecodeError, IOError) as e:
                 self.logger.warning(
-                    f"User map file corrupted or unreadable ({e}); starting fresh."
+                    "User map file corrupted or unreadable; starting fresh",
+                    error=str(e),
                 )
         return {}, 1
 
+    @staticmethod
+    def _next_user_num(user_map: Dict[str, str]) -> int:
+        """Returns one more than the highest User_<n> in user_map."""
+        max_n = 0
+        for v in user_map.values():
+            if isinstance(v, str) and v.startswith("User_"):
+                try:
+                    n = int(v.split("_", 1)[1])
+                    if n > max_n:
+                        max_n = n
+                except (ValueError, IndexError):
+                    pass
+        return max_n + 1
+
     def anonymize(self, sender_id: str) -> str:
         """
         Returns an anonymized user ID for the given sender ID, creating a new
         one if necessary.
         """
+        # Sender IDs read from the database are already str, for which str()
+        # returns the same object
         sid = str(sender_id)
-        if sid not in self.user_map:
-            self.user_map[sid] = f"User_{self.next_user_num}"
+        anon_id = self.user_map.get(sid)
+        if anon_id is None:
+            anon_id = f"User_{self.next_user_num}"
+            self.user_map[sid] = anon_id
             self.next_user_num += 1
-        return self.user_map[sid]
+        return anon_id
 
     def persist(self) -> None:
         """Saves the user map to disk."""
         try:
-            with open(self.user_map_file, "w", encoding="utf-8") as f:
-                json.dump(self.user_map, f, ensure_ascii=False, indent=2)
-            self.logger.info(f"User map saved to {self.user_map_file}")
+            # Store the counter too, so loading needn't scan every alias
+            data = {"next": self.next_user_num, "map": self.user_map}
+            with open(self.user_map_file, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            self.logger.info("User map saved", path=self.user_map_file)
         except IOError as e:
-            self.logger.error(f"Failed to save user map: {e}")
+            self.logger.error("Failed to save user map", error=str(e))
@@ -6,81 +6,107 @@ conversations based on time, topic, and reply-to links.
 """
 
 import hashlib
-from collections import OrderedDict, deque
+from collections import deque
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Any, Dict, Generator, List
 
 import structlog
-from dateutil.parser import isoparse
 
 from src.core.config import ConversationSettings
+from src.core.serializer import date_to_timestamp
 
 logger = structlog.get_logger(__name__)
 
 
-class LRUMessageMap(OrderedDict):
-    """A simple LRU map to keep track of recent messages for reply linking."""
+def _format_poll(content: Dict[str, Any]) -> str:
+    """Formats structured poll content into a readable string."""
+    question = content.get("question", "Poll")
+    options = content.get("options", [])
+    options_str = "\n".join(
+        f"- {opt.get('text', '')} ({opt.get('voters', 0)} votes)" for opt in options
+    )
+    total_voters = content.get("total_voters", 0)
+    return f"Poll: {question}\n{options_str}\nTotal Voters: {total_voters}"
+
+
+class LRUMessageMap(dict):
+    """
+    A bounded map of recent message IDs to their conversations, for reply
+    linking.
+
+    Entries are evicted oldest-inserted first, a batch at a time, rather
+    than in exact LRU order: replies almost always target recent messages,
+    and skipping the move-to-end on every hit keeps lookups a plain dict get.
+    """
+
+    __slots__ = ("maxlen",)
 
     def __init__(self, maxlen: int):
         super().__init__()
         self.maxlen = maxlen
 
     def set(self, key, value):
-        if key in self:
-            self.move_to_end(key)
         self[key] = value
         if len(self) > self.maxlen:
-            self.popitem(last=False)
+            # Dicts iterate in insertion order, so these are the oldest keys
+            for old_key in list(islice(self, max(1, self.maxlen // 20))):
+                del self[old_key]
 
     def get_recent(self, key):
-        v = self.get(key)
-        if v is not None:
-            self.move_to_end(key)
-        return v
+        return self.get(key)
 
 
 class ActiveConversation:
     """Represents a single, ongoing conversation."""
 
-    __slots__ = ("messages", "id_set", "start", "last", "topic_id", "topic_title")
+    __slots__ = (
+        "messages",
+        "start_ts",
+        "last_ts",
+        "topic_id",
+        "topic_title",
+    )
 
-    def __init__(self, first_msg: Dict[str, Any]):
+    def __init__(self, first_msg: Dict[str, Any], msg_ts: float):
         self.messages: List[Dict[str, Any]] = [first_msg]
-        self.id_set = {first_msg["id"]}
-        self.start = isoparse(first_msg["date"])
-        self.last = self.start
+        # Epoch seconds, so time checks are plain float arithmetic
+        self.start_ts = msg_ts
+        self.last_ts = msg_ts
         # Use topic_id for consistency
         self.topic_id = first_msg.get("topic_id")
         self.topic_title = first_msg.get("topic_title")
 
     def try_attach(
-        self, msg: Dict[str, Any], time_threshold: int, session_window: int
+        self,
+        msg: Dict[str, Any],
+        msg_ts: float,
+        time_threshold: int,
+        session_window: int,
     ) -> bool:
         """Tries to attach a message to this conversation based on time and topic."""
-        msg_dt = isoparse(msg["date"])
-        within_gap = (msg_dt - self.last).total_seconds() < time_threshold
-        within_window = (msg_dt - self.start).total_seconds() < session_window
+        within_gap = msg_ts - self.last_ts < time_threshold
+        within_window = msg_ts - self.start_ts < session_window
         # Use topic_id for consistency
         same_topic = self.topic_id == msg.get("topic_id")
 
         if within_window and same_topic and within_gap:
-            self._add_message(msg, msg_dt)
+            self._add_message(msg, msg_ts)
             return True
         return False
 
-    def attach_force(self, msg: Dict[str, Any]):
+    def attach_force(self, msg: Dict[str, Any], msg_ts: float):
         """Attaches a message regardless of time, e.g., for a direct reply."""
-        self._add_message(msg, isoparse(msg["date"]))
+        self._add_message(msg, msg_ts)
 
-    def is_expired(self, now_dt: datetime, session_window: int) -> bool:
+    def is_expired(self, now_ts: float, session_window: int) -> bool:
         """Checks if the conversation has exceeded the maximum session window."""
-        return (now_dt - self.start).total_seconds() >= session_window
+        return now_ts - self.start_ts >= session_window
 
-    def _add_message(self, msg: Dict[str, Any], msg_dt: datetime):
+    def _add_message(self, msg: Dict[str, Any], msg_ts: float):
         self.messages.append(msg)
-        self.id_set.add(msg["id"])
-        if msg_dt > self.last:
-            self.last = msg_dt
+        if msg_ts > self.last_ts:
+            self.last_ts = msg_ts
 
 
 class ConversationBuilder:
@@ -96,8 +122,11 @@ class ConversationBuilder:
     ):
         self.settings = conv_settings
         self.max_active_conversations = max_active
+        # Maps message ID to the active conversation holding it, for replies
         self.msg_map = LRUMessageMap(max_msg_map)
         self.active: deque[ActiveConversation] = deque()
+        # Newest active conversation per topic, for time-based attachment
+        self.by_topic: Dict[Any, ActiveConversation] = {}
         self.logger = structlog.get_logger(__name__)
 
     def process_stream(
@@ -109,112 +138,96 @@ class ConversationBuilder:
         total_msgs = 0
         for rec in message_stream:
             total_msgs += 1
-            now_dt = isoparse(rec["date"])
+            # ExternalSorter has already parsed the date; parse it here otherwise
+            now_ts = rec.pop("_ts", None)
+            if now_ts is None:
+                now_ts = date_to_timestamp(rec["date"])
 
             # First, flush any conversations that have expired relative to the current message
             while self.active and self.active[0].is_expired(
-                now_dt, self.settings.session_window_seconds
+                now_ts, self.settings.session_window_seconds
             ):
-                yield self._create_envelope(self.active.popleft())
+                yield self._close_oldest()
 
-            self._assign_to_conversation(rec)
+            self._assign_to_conversation(rec, now_ts)
 
             # Bound the number of active conversations to prevent memory issues
             while len(self.active) > self.max_active_conversations:
-                yield self._create_envelope(self.active.popleft())
+                yield self._close_oldest()
 
             if total_msgs % 100_000 == 0:
                 self.logger.info(
-                    f"Processed {total_msgs:,} msgs | active_convs={len(self.active)}"
+                    "Processed messages",
+                    messages=total_msgs,
+                    active_convs=len(self.active),
                 )
 
         # Flush all remaining conversations at the end of the stream
         while self.active:
-            yield self._create_envelope(self.active.popleft())
+            yield self._close_oldest()
 
-    def _assign_to_conversation(self, rec: Dict[str, Any]):
+    def _assign_to_conversation(self, rec: Dict[str, Any], msg_ts: float):
         """Assigns a single message to an existing or new conversation."""
         # 1. Try to attach via direct reply
         parent_id = rec.get("reply_to_msg_id")
-        parent_proxy = self.msg_map.get_recent(parent_id) if parent_id else None
-        if parent_proxy and hasattr(parent_proxy, "_conv_idx"):
-            try:
-                conv = self.active[parent_proxy._conv_idx]
-                conv.attach_force(rec)
-                self._update_message_map(rec)
-                return
-            except IndexError:
-                pass  # Conversation was already flushed, fall back to time-based
-
-        # 2. Try to attach by time/topic to recent conversations
-        for i in range(min(len(self.active), 200)):
-            conv = self.active[-1 - i]
-            if conv.try_attach(
-                rec,
-                self.settings.time_threshold_seconds,
-                self.settings.session_window_seconds,
-            ):
-                self._update_message_map(rec)
-                return
-
-        # 3. If not attached, create a new conversation
-        conv = ActiveConversation(rec)
-        self.active.append(conv)
-        self._update_message_map(rec)
-
-    def _update_message_map(self, rec: Dict[str, Any]):
-        """Updates the LRU message map with a proxy object for the message."""
-        try:
-            conv_idx = next(
-                len(self.active) - 1 - i
-                for i in range(min(len(self.active), 200))
-                if rec["id"] in self.active[-1 - i].id_set
-            )
-            # Create a lightweight proxy object to store in the map
-            rec_proxy = type("MsgProxy", (), {"id": rec["id"], "_conv_idx": conv_idx})()
-            self.msg_map.set(rec["id"], rec_proxy)
-        except (StopIteration, KeyError):
-            # Fallback if something goes wrong
-            rec_proxy = type("MsgProxy", (), {"id": rec["id"]})()
-            self.msg_map.set(rec["id"], rec_proxy)
+        conv = self.msg_map.get_recent(parent_id) if parent_id else None
+        if conv is not None:
+            conv.attach_force(rec, msg_ts)
+            self.msg_map.set(rec["id"], conv)
+            return
+
+        # 2. Try to attach by time to the topic's newest conversation
+        topic_id = rec.get("topic_id")
+        conv = self.by_topic.get(topic_id)
+        if conv is None or not conv.try_attach(
+            rec,
+            msg_ts,
+            self.settings.time_threshold_seconds,
+            self.settings.session_window_seconds,
+        ):
+            # 3. If not attached, create a new conversation
+            conv = ActiveConversation(rec, msg_ts)
+            self.active.append(conv)
+            self.by_topic[topic_id] = conv
+        self.msg_map.set(rec["id"], conv)
+
+    def _close_oldest(self) -> Dict[str, Any]:
+        """Removes the oldest active conversation and returns its envelope."""
+        conv = self.active.popleft()
+        if self.by_topic.get(conv.topic_id) is conv:
+            del self.by_topic[conv.topic_id]
+        # Replies to a closed conversation fall back to time-based attachment
+        msg_map = self.msg_map
+        for msg in conv.messages:
+            if msg_map.get(msg["id"]) is conv:
+                del msg_map[msg["id"]]
+        return self._create_envelope(conv)
 
     def _create_envelope(self, conv: ActiveConversation) -> Dict[str, Any]:
         """Creates the final conversation envelope for persistence."""
+        # One pass collects the texts and the distinct source files and names
         conv_texts = []
+        source_files = set()
+        source_names = set()
         for m in conv.messages:
             content = m.get("content", "")
             if isinstance(content, dict):
-                # Handle structured content like polls by formatting it into a readable string
-                question = content.get("question", "Poll")
-                options = content.get("options", [])
-                options_str = "\n".join(
-                    f"- {opt.get('text', '')} ({opt.get('voters', 0)} votes)"
-                    for opt in options
-                )
-                total_voters = content.get("total_voters", 0)
-                content = (
-                    f"Poll: {question}\n{options_str}\nTotal Voters: {total_voters}"
-                )
+                content = _format_poll(content)
             conv_texts.append(content or "")
+            source_file = m.get("source_saved_file")
+            if source_file:
+                source_files.add(source_file)
+            source_name = m.get("source_name")
+            if source_name:
+                source_names.add(source_name)
         joined = "\n".join(conv_texts)
         ingestion_hash = hashlib.md5(joined.encode("utf-8")).hexdigest()
 
-        source_files = list(
-            {
-                m.get("source_saved_file")
-                for m in conv.messages
-                if m.get("source_saved_file")
-            }
-        )
-        source_names = list(
-            {m.get("source_name") for m in conv.messages if m.get("source_name")}
-        )
-
         return {
             "ingestion_timestamp": datetime.now(timezone.utc).isoformat(),
             "ingestion_hash": ingestion_hash,
-            "source_files": source_files,
-            "source_names": source_names,
+            "source_files": list(source_files),
+            "source_names": list(source_names),
             "conversation": conv.messages,
             "message_count": len(conv.messages),
         }
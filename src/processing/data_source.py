@@ -18,6 +18,9 @@ class DataSource:
     Provides an iterator for messages stored in the database.
     """
 
+    # get_all_messages yields in date order, so ExternalSorter needn't sort
+    ordered_by_date = True
+
     def __init__(self, db: Database):
         """
         Initializes the DataSource with a database instance.
@@ -5,20 +5,35 @@ This module provides a top-level class that wires together all the components
 of the data processing pipeline, from data source to conversation building.
 """
 
-import json
 import os
-from typing import Any, Dict
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict
 
+import orjson
 import structlog
 
 from src.core.config import AppSettings
+from src.core.text_utils import NUMBER_RE, normalize_numbers
 from src.processing.anonymizer import Anonymizer
 from src.processing.conversation_builder import ConversationBuilder
 from src.processing.data_source import DataSource
-from src.processing.external_sorter import ExternalSorter
+from src.processing.external_sorter import (
+    FILE_BUFFER_SIZE,
+    MAX_PENDING_CHUNKS,
+    ExternalSorter,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Conversation envelopes encoded before each write to the output file
+WRITE_BATCH_SIZE = 1024
+
+# String fields that repeat across most messages; interning them keeps one
+# copy per distinct value for the records held in active conversations
+INTERNED_FIELDS = ("message_type", "topic_title", "source_name")
+
 
 class DataProcessingPipeline:
     """
@@ -43,8 +58,6 @@ class DataProcessingPipeline:
         self.conv_builder = conv_builder
         self.logger = structlog.get_logger(__name__)
         # Use the shared regex pattern from text_utils
-        from src.core.text_utils import NUMBER_RE
-
         self.number_re = NUMBER_RE
 
     def run(self) -> None:
@@ -70,7 +83,9 @@ class DataProcessingPipeline:
         self.anonymizer.persist()
 
         self.logger.info(
-            f"Stream processing complete: {total_convs:,} conversations written to {output_file}"
+            "Stream processing complete",
+            conversations=total_convs,
+            output_file=output_file,
         )
         self.logger.info("✅ Data processing complete.")
 
@@ -78,6 +93,11 @@ class DataProcessingPipeline:
         self, rec: Dict[str, Any], anonymizer: Anonymizer
     ) -> Dict[str, Any]:
         """Processes a single record: anonymization and normalization."""
+        for field in INTERNED_FIELDS:
+            value = rec.get(field)
+            if isinstance(value, str):
+                rec[field] = sys.intern(value)
+
         # Anonymize sender ID
         sender_id = rec.get("sender_id")
         if sender_id:
@@ -86,9 +106,6 @@ class DataProcessingPipeline:
         # Lightweight numeric normalization
         content = rec.get("content", "")
         if isinstance(content, str):
-            # Use the shared normalize_numbers function
-            from src.core.text_utils import normalize_numbers
-
             rec["normalized_values"] = normalize_numbers(content)
         else:
             rec["normalized_values"] = []
@@ -97,15 +114,48 @@ class DataProcessingPipeline:
 
     def _write_conversations(self, conversation_stream, output_file: str) -> int:
         """Writes the stream of conversation envelopes to the final JSON file."""
-        count = 0
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("[\n")
-            first = True
+        return write_conversations(conversation_stream, output_file)
+
+
+def write_conversations(conversation_stream, output_file: str) -> int:
+    """
+    Streams conversation envelopes to output_file as a JSON array.
+
+    Envelopes are encoded with orjson and written in batches of
+    WRITE_BATCH_SIZE, so the array is never held in memory as a whole. The
+    writes run on a background thread, so the file I/O overlaps with
+    building and encoding the next batch; a single writer keeps the batches
+    in order.
+
+    Returns:
+        The number of conversations written.
+    """
+    count = 0
+    parts = []
+    separator = b""  # Placed before each batch after the first
+    # Batch writes in flight on the writer thread, oldest first
+    pending: Deque[Future] = deque()
+    with open(output_file, "wb", buffering=FILE_BUFFER_SIZE) as f:
+        f.write(b"[\n")
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="conversation-writer"
+        ) as writer:
             for conv in conversation_stream:
-                if not first:
-                    f.write(",\n")
-                json.dump(conv, f, ensure_ascii=False)
-                first = False
+                parts.append(orjson.dumps(conv))
                 count += 1
-            f.write("\n]\n")
-        return count
+                if len(parts) >= WRITE_BATCH_SIZE:
+                    # Block only once MAX_PENDING_CHUNKS writes are queued
+                    if len(pending) >= MAX_PENDING_CHUNKS:
+                        pending.popleft().result()
+                    pending.append(
+                        writer.submit(f.write, separator + b",\n".join(parts))
+                    )
+                    separator = b",\n"
+                    parts = []
+            # Surface any write error before the array is closed
+            while pending:
+                pending.popleft().result()
+        if parts:
+            f.write(separator + b",\n".join(parts))
+        f.write(b"\n]\n")
+    return count
@@ -1,12 +1,15 @@
 """Small thin wrapper around litellm to centralize retries, logging and defaults.
 
-Keep it intentionally small: provides `complete()` and `embed()` which call
+Keep it intentionally small: provides `complete()` and `embed()` (plus the
+batching `embed_batch()` and concurrent `embed_many()`) which call
 the litellm library with sane defaults and basic retry/backoff. This lets
 the rest of the code avoid repeating retry logic and ensures consistent
 flags (cache=True) and logging.
 """
 
+import asyncio
 import os
+import random
 import time
 from dataclasses import asdict
 from typing import Dict, List, Optional
@@ -126,3 +129,128 @@ def embed(
             time.sleep(1 + attempt)
     logger.error("Embedding failed after %d attempts", max_retries)
     return []  # Return empty list instead of None
+
+
+def _embed_batch_size(batch_size: Optional[int]) -> int:
+    if batch_size is None:
+        batch_size = int(os.getenv("EMBEDDING_BATCH_SIZE", "96"))
+    return batch_size
+
+
+def embed_batch(
+    texts: List[str],
+    batch_size: Optional[int] = None,
+    max_retries: Optional[int] = None,
+) -> List[List[float]]:
+    """Embed texts in groups of at most batch_size per request.
+
+    Provider batch endpoints cap the inputs per call (Gemini rejects more
+    than 100), so large inputs are split and the vectors concatenated in
+    input order. Returns [] if any group fails, like embed.
+    """
+    batch_size = _embed_batch_size(batch_size)
+    if len(texts) <= batch_size:
+        return embed(texts, max_retries=max_retries)
+
+    vectors: List[List[float]] = []
+    for start in range(0, len(texts), batch_size):
+        group = texts[start : start + batch_size]
+        group_vectors = embed(group, max_retries=max_retries)
+        if len(group_vectors) != len(group):
+            logger.error(
+                "Embedding batch at offset %d returned %d of %d vectors",
+                start,
+                len(group_vectors),
+                len(group),
+            )
+            return []
+        vectors.extend(group_vectors)
+    return vectors
+
+
+@retry_with_backoff(max_retries=3, initial_wait=1.0, backoff_factor=2.0)
+@handle_critical_errors(default_alert_manager)
+async def _aembed_group(
+    texts: List[str], max_retries: Optional[int] = None
+) -> List[List[float]]:
+    """Async counterpart of embed for a single request."""
+    router = _get_router()
+    embedding_model_name = os.getenv("EMBEDDING_MODEL_NAME", "gemini-embedding-model")
+    if max_retries is None:
+        max_retries = int(os.getenv("EMBEDDING_MAX_RETRIES", "2"))
+
+    for attempt in range(max_retries):
+        try:
+            resp = await router.aembedding(model=embedding_model_name, input=texts)
+            if resp and resp.get("data"):
+                return [item.get("embedding") for item in resp["data"]]
+        except Exception as e:
+            logger.warning(
+                "Embedding attempt %d/%d failed: %s",
+                attempt + 1,
+                max_retries,
+                e,
+                exc_info=True,
+            )
+            # Jitter spreads out the retries of batches that failed together
+            await asyncio.sleep(1 + attempt + random.random())
+    logger.error("Embedding failed after %d attempts", max_retries)
+    return []
+
+
+async def aembed(
+    texts: List[str],
+    batch_size: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    max_retries: Optional[int] = None,
+) -> List[List[float]]:
+    """Like embed_batch, but keeps up to max_in_flight requests running at once.
+
+    Embedding calls are latency-bound, so overlapping them speeds up bulk
+    inputs when the provider tolerates parallel requests.
+    """
+    batch_size = _embed_batch_size(batch_size)
+    if max_in_flight is None:
+        max_in_flight = int(os.getenv("EMBEDDING_MAX_IN_FLIGHT", "5"))
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def embed_group(group: List[str]) -> List[List[float]]:
+        async with semaphore:
+            return await _aembed_group(group, max_retries=max_retries)
+
+    groups = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+    # gather returns results in submission order, whatever order they finish in
+    results = await asyncio.gather(*(embed_group(group) for group in groups))
+
+    vectors: List[List[float]] = []
+    for group, group_vectors in zip(groups, results):
+        if len(group_vectors) != len(group):
+            logger.error(
+                "Embedding batch returned %d of %d vectors",
+                len(group_vectors),
+                len(group),
+            )
+            return []
+        vectors.extend(group_vectors)
+    return vectors
+
+
+def embed_many(
+    texts: List[str],
+    batch_size: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+) -> List[List[float]]:
+    """Synchronous entry point for aembed.
+
+    asyncio.run cannot start inside a running event loop, so a call from
+    async code falls back to the serial embed_batch; async callers should
+    await aembed directly instead.
+    """
+    batch_size = _embed_batch_size(batch_size)
+    if len(texts) <= batch_size:
+        return embed(texts)  # A single request needs no event loop
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(aembed(texts, batch_size, max_in_flight))
+    return embed_batch(texts, batch_size)
@@ -13,6 +13,12 @@ from src.rag import litellm_client
 
 logger = structlog.get_logger(__name__)
 
+# Compiled once at import; sanitize_query_text runs for every user query
+_WHITESPACE_RE = re.compile(r"\s+")
+_ANGLE_BRACKETS_RE = re.compile(r"[<>]")
+_JAVASCRIPT_RE = re.compile(r"javascript:", re.IGNORECASE)
+_DATA_RE = re.compile(r"data:", re.IGNORECASE)
+
 
 def sanitize_query_text(text: str) -> str:
     """
@@ -28,12 +34,12 @@ def sanitize_query_text(text: str) -> str:
         return ""
 
     # Remove excessive whitespace and normalize
-    sanitized = re.sub(r"\s+", " ", text.strip())
+    sanitized = _WHITESPACE_RE.sub(" ", text.strip())
 
     # Remove potentially harmful patterns
-    sanitized = re.sub(r"[<>]", "", sanitized)  # Remove angle brackets
-    sanitized = re.sub(r"javascript:", "", sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r"data:", "", sanitized, flags=re.IGNORECASE)
+    sanitized = _ANGLE_BRACKETS_RE.sub("", sanitized)  # Remove angle brackets
+    sanitized = _JAVASCRIPT_RE.sub("", sanitized)
+    sanitized = _DATA_RE.sub("", sanitized)
 
     return sanitized[:2000]  # Limit length
 
@@ -45,7 +51,7 @@ class LiteLLMEmbeddingFunction(EmbeddingFunction):
         self._model_name = model_name
 
     def __call__(self, input: Documents) -> Embeddings:
-        return litellm_client.embed(input)
+        return litellm_client.embed_many(input)
 
     @classmethod
     def name(cls) -> str:
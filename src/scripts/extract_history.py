@@ -73,7 +73,9 @@ async def main():
         group_cache = {}  # Cache to store group info and avoid redundant API calls
         for i, gid in enumerate(group_ids, 1):
             try:
-                entity = await client.get_chat(gid)
+                # Metadata cached by a recent run saves a get_chat round-trip
+                cached = await asyncio.to_thread(storage.get_group_meta, gid)
+                entity = cached[0] if cached else await client.get_chat(gid)
                 group_cache[gid] = entity  # Cache the group info
                 group_name = getattr(entity, "title", f"Group {gid}")
                 logging.info(f"  {i:2d}. {group_name}")
@@ -142,10 +144,12 @@ async def main():
 
         # Ensure all data is saved and resources are cleaned up
         try:
-            storage.save_last_msg_ids(last_msg_ids)
+            await asyncio.to_thread(storage.save_last_msg_ids, last_msg_ids)
             logging.info("\n💾 Progress tracking data saved.")
         except Exception as e:
             logging.error(f"\n❌ Failed to save progress tracking data: {e}")
+        finally:
+            await extractor.aclose()
 
         logging.info("\n🎉 Extraction complete.")
 
@@ -68,7 +68,7 @@ class NuggetEmbedder(NuggetEmbedderInterface):
             embed_attempts = 2
             embedding_response = None
             for attempt in range(embed_attempts):
-                emb = litellm_client.embed(docs_to_embed, max_retries=1)
+                emb = litellm_client.embed_batch(docs_to_embed, max_retries=1)
                 if emb is not None:
                     embedding_response = {"data": [{"embedding": e} for e in emb]}
                 else:
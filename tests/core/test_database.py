@@ -0,0 +1,140 @@
+import sqlite3
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.database import MESSAGE_COLUMNS, MESSAGE_ROWS_PER_INSERT, Database
+
+
+def _make_message(msg_id, date="2024-01-01T12:00:00", **overrides):
+    msg = {
+        "id": msg_id,
+        "source_group_id": 100,
+        "topic_id": 0,
+        "date": date,
+        "sender_id": "user1",
+        "message_type": "text",
+        "content": f"message {msg_id}",
+        "extra_data": {},
+        "reply_to_msg_id": None,
+        "topic_title": "General",
+        "source_name": "Test Group",
+        "ingestion_timestamp": "2024-01-01T12:00:01",
+    }
+    msg.update(overrides)
+    return msg
+
+
+@pytest.fixture
+def db(temp_db_dir):
+    settings = MagicMock()
+    settings.db_dir = temp_db_dir
+    database = Database(settings)
+    yield database
+    database.close_all_connections()
+
+
+def test_insert_messages_commits_batch(db):
+    """A batch insert is visible once insert_messages returns."""
+    db.insert_messages([_make_message(i) for i in range(1, 6)])
+
+    assert len(list(db.get_all_messages())) == 5
+    assert not db._get_thread_local_connection().in_transaction
+
+
+def test_insert_messages_rolls_back_failed_batch(db):
+    """A failing row rolls back the whole batch."""
+    bad = _make_message(2, sender_id=object())  # Cannot be bound by sqlite3
+
+    with pytest.raises(sqlite3.Error):
+        db.insert_messages([_make_message(1), bad])
+
+    assert list(db.get_all_messages()) == []
+    assert not db._get_thread_local_connection().in_transaction
+
+
+def test_insert_messages_empty_is_noop(db):
+    db.insert_messages([])
+
+    assert list(db.get_all_messages()) == []
+
+
+def test_connection_is_reused_within_thread(db):
+    """Repeated calls on one thread share a single connection."""
+    with db._get_connection() as first:
+        pass
+    with db._get_connection() as second:
+        pass
+
+    assert first is second
+
+
+def test_close_all_connections_closes_other_threads(db):
+    """Connections opened on worker threads are closed too."""
+    opened = []
+    worker = threading.Thread(
+        target=lambda: opened.append(db._get_thread_local_connection())
+    )
+    worker.start()
+    worker.join()
+
+    db.close_all_connections()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        opened[0].execute("SELECT 1")
+    # The instance stays usable and reconnects on demand
+    assert list(db.get_all_messages()) == []
+
+
+def test_get_all_messages_ordered_by_date_index(db):
+    """Messages come back in date order without an SQLite sort step."""
+    db.insert_messages(
+        [
+            _make_message(1, date="2024-01-03T00:00:00"),
+            _make_message(2, date="2024-01-01T00:00:00"),
+            _make_message(3, date="2024-01-02T00:00:00"),
+        ]
+    )
+
+    assert [m["id"] for m in db.get_all_messages()] == [2, 3, 1]
+    with db._get_connection() as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM messages ORDER BY date"
+        ).fetchall()
+    assert "USING INDEX idx_messages_date" in plan[0][-1]
+
+
+def test_insert_messages_spans_multiple_statements(db):
+    """Batches larger than one multi-row INSERT are written completely."""
+    count = MESSAGE_ROWS_PER_INSERT * 2 + 5
+    db.insert_messages([_make_message(i) for i in range(count)])
+
+    assert len(list(db.get_all_messages())) == count
+
+
+def test_insert_message_rows_writes_preserialized_rows(db):
+    """Rows in MESSAGE_COLUMNS order are stored as-is in one transaction."""
+    msg = _make_message(7, extra_data='{"k": 1}')
+    db.insert_message_rows([tuple(msg[column] for column in MESSAGE_COLUMNS)])
+
+    (stored,) = db.get_all_messages()
+    assert stored["id"] == 7
+    assert stored["extra_data"] == {"k": 1}
+    assert not db._get_thread_local_connection().in_transaction
+
+
+def test_insert_message_rows_commits_cursors_with_rows(db):
+    """Topic cursors are stored with the rows and roll back with them."""
+    msg = _make_message(8, extra_data="{}")
+    db.insert_message_rows(
+        [tuple(msg[column] for column in MESSAGE_COLUMNS)], {(100, 0): 8}
+    )
+    bad = _make_message(9, sender_id=object())  # Cannot be bound by sqlite3
+
+    with pytest.raises(sqlite3.Error):
+        db.insert_message_rows(
+            [tuple(bad[column] for column in MESSAGE_COLUMNS)], {(100, 0): 9}
+        )
+
+    assert db.get_cursors() == {(100, 0): 8}
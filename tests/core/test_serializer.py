@@ -39,6 +39,15 @@ def test_serialize_extra_data_with_non_dict():
     assert parsed == {"value": "not a dict"}
 
 
+def test_serialize_extra_data_with_nested_values():
+    """Nested datetimes and unknown objects are encoded in a single pass."""
+    dt = datetime(2023, 1, 1, 12, 0, 0)
+    data = {"poll": {"close_date": dt, "tags": ["a", 1]}, "obj": object}
+    result = json.loads(serialize_extra_data(data))
+    assert result["poll"] == {"close_date": dt.isoformat(), "tags": ["a", 1]}
+    assert result["obj"] == str(object)
+
+
 def test_deserialize_extra_data():
     """Test deserialize_extra_data function."""
     data = {"key": "value"}
@@ -101,3 +110,9 @@ def test_serialize_date_with_timestamp():
     # We just need to verify it returns a string, as the exact time depends on timezone
     assert isinstance(result, str)
     assert len(result) > 0
+
+
+def test_serialize_extra_data_with_non_str_keys():
+    """Int keys are stringified and unencodable keys use the str() fallback."""
+    assert json.loads(serialize_extra_data({1: "a"})) == {"1": "a"}
+    assert json.loads(serialize_extra_data({(1, 2): "b"})) == {"(1, 2)": "b"}
@@ -2,7 +2,7 @@
 Tests for the simple error handler module.
 """
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -106,6 +106,55 @@ async def test_retry_on_failure_async_success():
         mock_warning.assert_called_once()
 
 
+def test_retry_on_failure_caps_delay():
+    """Backoff grows until max_delay and then stays there."""
+
+    @retry_on_failure(
+        max_retries=4, delay=1.0, backoff=3.0, max_delay=5.0, jitter=False
+    )
+    def always_failing_function():
+        raise ConnectionError("Permanent error")
+
+    with patch("src.core.simple_error_handler.time.sleep") as mock_sleep:
+        with pytest.raises(ConnectionError):
+            always_failing_function()
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 3.0, 5.0, 5.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_on_failure_jitter_stays_within_delay():
+    """With jitter each sleep is drawn from [0, current delay]."""
+
+    @retry_on_failure(max_retries=3, delay=2.0, backoff=2.0, max_delay=3.0)
+    async def always_failing_async_function():
+        raise ConnectionError("Permanent error")
+
+    with patch(
+        "src.core.simple_error_handler.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        with pytest.raises(ConnectionError):
+            await always_failing_async_function()
+
+    sleeps = [c.args[0] for c in mock_sleep.call_args_list]
+    assert len(sleeps) == 3
+    assert 0 <= sleeps[0] <= 2.0
+    assert all(0 <= s <= 3.0 for s in sleeps[1:])
+
+
+def test_retry_on_failure_zero_retries_returns_function():
+    """With max_retries=0 the decorator returns the function unwrapped."""
+
+    def plain_function():
+        return "result"
+
+    async def plain_async_function():
+        return "result"
+
+    assert retry_on_failure(max_retries=0)(plain_function) is plain_function
+    assert retry_on_failure(max_retries=0)(plain_async_function) is plain_async_function
+
+
 def test_safe_call_success():
     """Test safe_call with a function that succeeds."""
 
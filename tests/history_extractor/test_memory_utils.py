@@ -0,0 +1,61 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from src.history_extractor import memory_utils
+
+
+def _reset_cache():
+    memory_utils._last_rss = (float("-inf"), 0)
+
+
+def test_get_memory_usage_reports_current_rss():
+    """The reading comes from the live RSS, not a zero placeholder."""
+    _reset_cache()
+
+    assert memory_utils.get_memory_usage() > 0
+
+
+def test_get_memory_usage_is_cached_within_ttl():
+    """Repeated calls inside the TTL reuse the last reading."""
+    _reset_cache()
+    with patch.object(memory_utils, "_read_rss", side_effect=[1024, 2048]) as read:
+        with patch.object(memory_utils.time, "monotonic", side_effect=[10.0, 10.1]):
+            assert memory_utils.get_memory_usage() == 1024
+            assert memory_utils.get_memory_usage() == 1024
+
+    assert read.call_count == 1
+
+
+def test_get_memory_usage_refreshes_after_ttl():
+    _reset_cache()
+    with patch.object(memory_utils, "_read_rss", side_effect=[1024, 2048]):
+        with patch.object(
+            memory_utils.time,
+            "monotonic",
+            side_effect=[10.0, 10.0 + memory_utils.RSS_CACHE_TTL],
+        ):
+            assert memory_utils.get_memory_usage() == 1024
+            assert memory_utils.get_memory_usage() == 2048
+
+
+def test_read_rss_falls_back_without_proc():
+    """Platforms without /proc fall back to getrusage."""
+    with patch.object(memory_utils, "_STATM_PATH", "/nonexistent/statm"):
+        assert memory_utils._read_rss() > 0
+
+
+def test_estimate_message_size_matches_encoded_length():
+    """Nested and non-JSON values are sized by their encoded form."""
+    small = memory_utils.estimate_message_size({"id": 1, "content": "hi"})
+    large = memory_utils.estimate_message_size(
+        {
+            "id": 1,
+            "content": "hi",
+            "extra_data": {"poll": {"options": ["a" * 50, "b" * 50]}},
+            "date": datetime(2024, 1, 1),
+            1: "non-string key",
+        }
+    )
+
+    assert small == len(b'{"id":1,"content":"hi"}') + 100
+    assert large > small + 100
@@ -1,4 +1,5 @@
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 from src.history_extractor.message_processor import get_message_details
@@ -90,3 +91,35 @@ class TestMessageProcessor(unittest.TestCase):
         self.assertEqual(len(content["options"]), 2)
         self.assertEqual(content["total_voter_count"], 30)
         self.assertEqual(extra_data["poll_id"], 12345)
+
+    def test_get_message_details_poll_option_correct(self):
+        """
+        Test that "correct" is stored whenever the option defines it, even as
+        None for non-quiz polls, and omitted only when the attribute is absent.
+        """
+        # Arrange
+        poll = SimpleNamespace(
+            question="2 + 2?",
+            options=[
+                SimpleNamespace(text="4", voter_count=3, correct=True),
+                SimpleNamespace(text="5", voter_count=1, correct=None),
+                SimpleNamespace(text="6", voter_count=0),
+            ],
+            id=7,
+        )
+        msg = SimpleNamespace(text="", poll=poll, sender_chat=None)
+
+        # Act
+        msg_type, content, extra_data = get_message_details(msg)
+
+        # Assert
+        self.assertEqual(msg_type, "poll")
+        self.assertEqual(
+            content["options"],
+            [
+                {"text": "4", "voter_count": 3, "correct": True},
+                {"text": "5", "voter_count": 1, "correct": None},
+                {"text": "6", "voter_count": 0},
+            ],
+        )
+        self.assertIsNone(extra_data["sender_chat_id"])
@@ -1,7 +1,10 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
-from src.history_extractor.storage import Storage
+from src.core.database import MESSAGE_COLUMNS
+from src.history_extractor.storage import MessageRow, Storage
 
 
 class TestStorage(unittest.TestCase):
@@ -31,10 +34,10 @@ class TestStorage(unittest.TestCase):
         # Act
         self.storage.save_messages_to_db("chat_title", 123, messages)
 
-        # Assert - with buffering, insert_messages is not called immediately
+        # Assert - with buffering, insert_message_rows is not called immediately
         # but the messages should be stored in the buffer
         self.assertEqual(len(self.storage.message_buffer), 1)
-        mock_db.insert_messages.assert_not_called()
+        mock_db.insert_message_rows.assert_not_called()
 
     def test_save_messages_to_db_flushes_buffer(self):
         """
@@ -51,7 +54,55 @@ class TestStorage(unittest.TestCase):
         self.storage.save_messages_to_db("chat_title", 123, messages)
 
         # Assert - with 1000 messages, buffer should be flushed
-        mock_db.insert_messages.assert_called_once()
+        mock_db.insert_message_rows.assert_called_once()
+
+    def test_save_messages_to_db_does_not_mutate_input(self):
+        """
+        Test that buffered rows are built without touching the caller's dicts.
+        """
+        # Arrange
+        self.storage.buffer_size = 1000
+        messages = [{"id": 1, "content": "hello", "group_id": -100}]
+
+        # Act
+        self.storage.save_messages_to_db("chat_title", 123, messages)
+
+        # Assert
+        self.assertEqual(messages, [{"id": 1, "content": "hello", "group_id": -100}])
+        buffered = dict(zip(MESSAGE_COLUMNS, self.storage.message_buffer[0]))
+        self.assertEqual(buffered["source_name"], "chat_title")
+        self.assertEqual(buffered["source_group_id"], -100)
+        self.assertEqual(buffered["topic_id"], 123)
+        self.assertEqual(buffered["extra_data"], "{}")
+
+    def test_save_messages_to_db_accepts_message_rows(self):
+        """
+        Test that MessageRow tuples are buffered as complete database rows.
+        """
+        # Arrange
+        self.storage.buffer_size = 1000
+        row = MessageRow(
+            id=1,
+            date="2024-01-01T00:00:00",
+            sender_id=42,
+            message_type="text",
+            content="hello",
+            extra_data={},
+            reply_to_msg_id=None,
+            topic_id=5,
+            topic_title="General",
+            source_group_id=-100,
+        )
+
+        # Act
+        self.storage.save_messages_to_db("chat_title", 5, [row])
+
+        # Assert
+        buffered = dict(zip(MESSAGE_COLUMNS, self.storage.message_buffer[0]))
+        self.assertEqual(buffered["content"], "hello")
+        self.assertEqual(buffered["source_group_id"], -100)
+        self.assertEqual(buffered["source_name"], "chat_title")
+        self.assertIsNotNone(buffered["ingestion_timestamp"])
 
     def test_load_last_msg_ids(self):
         """
@@ -72,15 +123,139 @@ class TestStorage(unittest.TestCase):
         Test saving the last processed message ID for each topic.
         """
         # Arrange
-        with patch(
-            "src.history_extractor.storage.open", unittest.mock.mock_open()
-        ) as mock_open:
+        self.mock_settings.paths.tracking_file = "tracking.json"
+        with (
+            patch(
+                "src.history_extractor.storage.open", unittest.mock.mock_open()
+            ) as mock_open,
+            patch("src.history_extractor.storage.os.replace") as mock_replace,
+        ):
             data = {"key": 123}
 
             # Act
             self.storage.save_last_msg_ids(data)
 
-            # Assert
-            mock_open.assert_called_once_with(
-                self.mock_settings.paths.tracking_file, "w"
-            )
+            # Assert - written to a temp file, then renamed over the original
+            mock_open.assert_called_once_with("tracking.json.tmp", "wb")
+            mock_replace.assert_called_once_with("tracking.json.tmp", "tracking.json")
+
+    def test_flush_commits_cursor_with_rows(self):
+        """
+        Test that a batch's cursor is written in the same call as its rows.
+        """
+        # Arrange
+        written = []
+        self.mock_app_context.db.insert_message_rows.side_effect = (
+            lambda rows, cursors: written.append((list(rows), dict(cursors)))
+        )
+        self.storage.buffer_size = 1000
+        messages = [{"id": 1, "content": "a"}, {"id": 2, "content": "b"}]
+
+        # Act
+        self.storage.save_messages_to_db("chat_title", 5, messages, ((-100, 5), 2))
+        self.storage.close()
+
+        # Assert
+        ((rows, cursors),) = written
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(cursors, {(-100, 5): 2})
+        self.assertEqual(self.storage._pending_cursors, {})
+
+    def test_batches_from_several_topics_share_one_commit(self):
+        """
+        Test that buffered batches from different topics are flushed together,
+        and that a buffer older than BUFFER_MAX_AGE is flushed early.
+        """
+        # Arrange
+        mock_db = MagicMock()
+        self.mock_app_context.db = mock_db
+        self.storage.buffer_size = 4
+        batch = [{"id": 1, "content": "a"}, {"id": 2, "content": "b"}]
+
+        # Act
+        with patch(
+            "src.history_extractor.storage.time.monotonic",
+            side_effect=[100.0, 100.1, 100.5, 200.0],
+        ):
+            self.storage.save_messages_to_db("group_a", 1, batch, ((-100, 1), 2))
+            self.storage.save_messages_to_db("group_b", 2, batch, ((-100, 2), 2))
+            commits_when_full = mock_db.insert_message_rows.call_count
+            self.storage.save_messages_to_db("group_a", 1, batch[:1], ((-100, 1), 3))
+
+        # Assert
+        self.assertEqual(commits_when_full, 1)
+        self.assertEqual(mock_db.insert_message_rows.call_count, 2)
+
+    def test_load_last_msg_ids_prefers_higher_db_cursor(self):
+        """
+        Test that database cursors are merged over the tracking file.
+        """
+        # Arrange
+        self.mock_app_context.db.get_cursors.return_value = {
+            (-100, 5): 40,
+            (-100, 6): 3,
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            self.mock_settings.paths.tracking_file = os.path.join(tmp, "t.json")
+            with patch.object(self.storage, "_flush_buffer"):
+                self.storage.save_last_msg_ids({(-100, 5): 30, (-100, 6): 9})
+
+            # Act
+            result = self.storage.load_last_msg_ids()
+
+        # Assert
+        self.assertEqual(result, {(-100, 5): 40, (-100, 6): 9})
+
+    def test_last_msg_ids_round_trip_tuple_keys(self):
+        """
+        Test that (group_id, topic_id) keys survive a save and load.
+        """
+        # Arrange
+        with tempfile.TemporaryDirectory() as tmp:
+            self.mock_settings.paths.tracking_file = os.path.join(tmp, "t.json")
+            data = {(-100123, 0): 10, (-100123, 7): 42}
+
+            # Act
+            self.storage.save_last_msg_ids(data)
+            result = self.storage.load_last_msg_ids()
+
+        # Assert
+        self.assertEqual(result, data)
+
+    def test_group_meta_round_trip_and_expiry(self):
+        """
+        Test that cached group metadata is returned until its TTL lapses.
+        """
+        # Arrange
+        entity = MagicMock(id=-100123, title="Forum", is_forum=True)
+        topic = MagicMock(
+            message_thread_id=7,
+            icon_color=123,
+            is_closed=False,
+            is_hidden=False,
+            is_pinned=True,
+        )
+        topic.name = "Topic"
+        self.mock_settings.telegram.extraction.group_meta_ttl = 60
+        with tempfile.TemporaryDirectory() as tmp:
+            self.mock_settings.paths.group_meta_file = os.path.join(tmp, "meta.json")
+
+            # Act
+            with patch("src.history_extractor.storage.time.time", return_value=1000):
+                self.storage.save_group_meta(-100123, entity, [topic])
+                fresh = self.storage.get_group_meta(-100123)
+            with patch("src.history_extractor.storage.time.time", return_value=1060):
+                expired = self.storage.get_group_meta(-100123)
+            self.storage.invalidate_group_meta(-100123)
+            with patch("src.history_extractor.storage.time.time", return_value=1000):
+                invalidated = self.storage.get_group_meta(-100123)
+
+        # Assert
+        cached_entity, cached_topics = fresh
+        self.assertEqual(cached_entity.id, -100123)
+        self.assertEqual(cached_entity.title, "Forum")
+        self.assertTrue(cached_entity.is_forum)
+        self.assertEqual(cached_topics[0].message_thread_id, 7)
+        self.assertEqual(cached_topics[0].name, "Topic")
+        self.assertIsNone(expired)
+        self.assertIsNone(invalidated)
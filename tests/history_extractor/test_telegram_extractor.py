@@ -1,7 +1,9 @@
 import asyncio
 import os
 import tempfile
+import threading
 import unittest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.core.app import initialize_app
@@ -55,6 +57,7 @@ class TestTelegramExtractor(unittest.TestCase):
         self.mock_client.get_chat = AsyncMock()
         self.mock_client.invoke = AsyncMock()
         self.mock_storage = MagicMock()
+        self.mock_storage.get_group_meta.return_value = None
         self.extractor = TelegramExtractor(self.mock_client, self.mock_storage)
 
         # Override settings with real values for the extraction settings
@@ -115,8 +118,277 @@ class TestTelegramExtractor(unittest.TestCase):
 
         # Assert
         self.assertEqual(result, 1)
-        self.mock_client.get_chat_history.assert_called_once()
+        self.mock_client.get_chat_history.assert_called_once_with(
+            123, min_id=0, reverse=True
+        )
+        self.mock_storage.save_messages_to_db.assert_called_once()
+
+    @patch("src.history_extractor.telegram_extractor.get_message_details")
+    def test_extract_from_topic_checkpoints_each_chunk(self, mock_get_message_details):
+        """Each full batch is saved and then checkpointed in the tracking file."""
+        # Arrange
+        from datetime import datetime
+
+        mock_entity = MagicMock()
+        mock_entity.id = 123
+        mock_entity.title = "Test Group"
+
+        mock_topic = MagicMock()
+        mock_topic.message_thread_id = 456
+        mock_topic.name = "Test Topic"
+
+        messages = []
+        for msg_id in range(1, 6):
+            msg = MagicMock()
+            msg.id = msg_id
+            msg.date = datetime(2024, 1, 1)
+            msg.from_user = None
+            msg.sender_chat = None
+            msg.message_thread_id = 456
+            msg.reply_to_message_id = None
+            msg.service = False
+            messages.append(msg)
+        self.mock_client.get_chat_history.return_value = MockAsyncIterator(messages)
+        mock_get_message_details.return_value = ("text", "hello", {})
+
+        last_msg_ids = {}
+
+        # Act
+        with patch(
+            "src.history_extractor.telegram_extractor.calculate_dynamic_batch_size",
+            return_value=2,
+        ):
+            result = asyncio.run(
+                self.extractor.extract_from_topic(mock_entity, mock_topic, last_msg_ids)
+            )
+
+        # Assert
+        self.assertEqual(result, 5)
+        batches = [
+            len(c.args[2]) for c in self.mock_storage.save_messages_to_db.call_args_list
+        ]
+        self.assertEqual(batches, [2, 2, 1])
+        cursors = [
+            c.args[3] for c in self.mock_storage.save_messages_to_db.call_args_list
+        ]
+        self.assertEqual(cursors, [((123, 456), 2), ((123, 456), 4), ((123, 456), 5)])
+        self.mock_storage.save_last_msg_ids.assert_called_once_with({(123, 456): 5})
+        self.assertEqual(last_msg_ids, {(123, 456): 5})
+
+    @patch("src.history_extractor.telegram_extractor.get_message_details")
+    def test_extract_from_topic_skips_media_only_messages(
+        self, mock_get_message_details
+    ):
+        """Messages without text or a poll are skipped before being parsed."""
+        # Arrange
+        mock_entity = MagicMock(id=123, title="Test Group")
+        mock_topic = MagicMock(message_thread_id=0)
+        mock_topic.name = "General"
+        photo = MagicMock(
+            id=1, text=None, poll=None, media="photo", message_thread_id=None
+        )
+        photo.service = None
+        self.mock_client.get_chat_history.return_value = MockAsyncIterator([photo])
+
+        # Act
+        result = asyncio.run(
+            self.extractor.extract_from_topic(mock_entity, mock_topic, {})
+        )
+
+        # Assert
+        self.assertEqual(result, 0)
+        mock_get_message_details.assert_not_called()
+
+    @patch("src.history_extractor.telegram_extractor.get_message_details")
+    def test_extract_from_topic_reports_progress_on_a_timer(
+        self, mock_get_message_details
+    ):
+        """Progress is logged by a timer task while messages keep arriving."""
+        # Arrange
+        from datetime import datetime
+
+        mock_entity = MagicMock(id=123, title="Test Group")
+        mock_topic = MagicMock(message_thread_id=456)
+        mock_topic.name = "Test Topic"
+
+        class SlowHistory(MockAsyncIterator):
+            async def __anext__(self):
+                await asyncio.sleep(0.02)
+                return await super().__anext__()
+
+        messages = [
+            MagicMock(
+                id=msg_id,
+                date=datetime(2024, 1, 1),
+                from_user=None,
+                sender_chat=None,
+                message_thread_id=456,
+                reply_to_message_id=None,
+                service=False,
+            )
+            for msg_id in range(1, 6)
+        ]
+        self.mock_client.get_chat_history.return_value = SlowHistory(list(messages))
+        mock_get_message_details.return_value = ("text", "hello", {})
+        self.extractor.settings.telegram.extraction.ui_update_interval = 0.01
+
+        # Act
+        with (
+            patch(
+                "src.history_extractor.telegram_extractor.MIN_UI_UPDATE_INTERVAL",
+                0.01,
+            ),
+            patch("src.history_extractor.telegram_extractor.logger") as mock_logger,
+        ):
+            result = asyncio.run(
+                self.extractor.extract_from_topic(mock_entity, mock_topic, {})
+            )
+
+        # Assert
+        self.assertEqual(result, 5)
+        progress = [
+            c.kwargs
+            for c in mock_logger.info.call_args_list
+            if c.args == ("Topic progress",)
+        ]
+        self.assertTrue(progress)
+        self.assertEqual(progress[0]["topic"], "Test Topic")
+
+        # A zero interval is clamped to MIN_UI_UPDATE_INTERVAL (1 second), so
+        # this short run logs no progress instead of spinning the timer
+        self.mock_client.get_chat_history.return_value = SlowHistory(list(messages))
+        self.extractor.settings.telegram.extraction.ui_update_interval = 0
+        with patch("src.history_extractor.telegram_extractor.logger") as mock_logger:
+            result = asyncio.run(
+                self.extractor.extract_from_topic(mock_entity, mock_topic, {})
+            )
+        self.assertEqual(result, 5)
+        self.assertNotIn(
+            ("Topic progress",), [c.args for c in mock_logger.info.call_args_list]
+        )
+
+    @patch("src.history_extractor.telegram_extractor.get_message_details")
+    def test_extract_from_topic_flushes_on_batch_bytes(self, mock_get_message_details):
+        """Large messages flush a batch before it reaches batch_size."""
+        # Arrange
+        from datetime import datetime
+
+        mock_entity = MagicMock()
+        mock_entity.id = 123
+        mock_entity.title = "Test Group"
+        mock_topic = MagicMock()
+        mock_topic.message_thread_id = 456
+        mock_topic.name = "Test Topic"
+
+        messages = []
+        for msg_id in range(1, 5):
+            msg = MagicMock()
+            msg.id = msg_id
+            msg.date = datetime(2024, 1, 1)
+            msg.from_user = None
+            msg.sender_chat = None
+            msg.message_thread_id = 456
+            msg.reply_to_message_id = None
+            msg.service = False
+            messages.append(msg)
+        self.mock_client.get_chat_history.return_value = MockAsyncIterator(messages)
+        mock_get_message_details.return_value = ("text", "x" * 600, {})
+        self.extractor.settings.telegram.extraction.max_batch_bytes = 1000
+
+        # Act
+        result = asyncio.run(
+            self.extractor.extract_from_topic(mock_entity, mock_topic, {})
+        )
+
+        # Assert - every second 600-byte message crosses the 1000-byte limit
+        self.assertEqual(result, 4)
+        batches = [
+            len(c.args[2]) for c in self.mock_storage.save_messages_to_db.call_args_list
+        ]
+        self.assertEqual(batches, [2, 2])
+
+    @patch("src.history_extractor.telegram_extractor.get_message_details")
+    def test_extract_from_topic_surfaces_history_errors(self, mock_get_message_details):
+        """An error while paging the history is raised, not swallowed."""
+        # Arrange
+        mock_entity = MagicMock()
+        mock_entity.id = 123
+        mock_entity.title = "Test Group"
+        mock_topic = MagicMock()
+        mock_topic.message_thread_id = 456
+        mock_topic.name = "Test Topic"
+
+        class FailingHistory(MockAsyncIterator):
+            async def __anext__(self):
+                raise RuntimeError("connection lost")
+
+        self.mock_client.get_chat_history.return_value = FailingHistory([])
+
+        # Act & Assert
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.extractor.extract_from_topic(mock_entity, mock_topic, {}))
+
+    @patch("src.history_extractor.telegram_extractor.get_message_details")
+    def test_extract_from_topic_awaits_pending_save_on_error(
+        self, mock_get_message_details
+    ):
+        """A history error waits for the in-flight batch write before raising."""
+        # Arrange
+        from datetime import datetime
+
+        mock_entity = MagicMock()
+        mock_entity.id = 123
+        mock_entity.title = "Test Group"
+        mock_topic = MagicMock()
+        mock_topic.message_thread_id = 456
+        mock_topic.name = "Test Topic"
+
+        messages = []
+        for msg_id in range(1, 4):
+            msg = MagicMock()
+            msg.id = msg_id
+            msg.date = datetime(2024, 1, 1)
+            msg.from_user = None
+            msg.sender_chat = None
+            msg.message_thread_id = 456
+            msg.reply_to_message_id = None
+            msg.service = False
+            messages.append(msg)
+
+        class FailingHistory(MockAsyncIterator):
+            async def __anext__(self):
+                if self.items:
+                    return self.items.pop(0)
+                raise RuntimeError("connection lost")
+
+        self.mock_client.get_chat_history.return_value = FailingHistory(messages)
+        mock_get_message_details.return_value = ("text", "hello", {})
+        saved = threading.Event()
+
+        def slow_save(*args):
+            # Still writing when the history error reaches the consumer
+            threading.Event().wait(0.05)
+            saved.set()
+
+        self.mock_storage.save_messages_to_db.side_effect = slow_save
+        last_msg_ids = {}
+
+        # Act
+        with patch(
+            "src.history_extractor.telegram_extractor.calculate_dynamic_batch_size",
+            return_value=2,
+        ):
+            with self.assertRaises(RuntimeError):
+                asyncio.run(
+                    self.extractor.extract_from_topic(
+                        mock_entity, mock_topic, last_msg_ids
+                    )
+                )
+
+        # Assert - the first batch was committed; the partial one is re-fetched
+        self.assertTrue(saved.is_set())
         self.mock_storage.save_messages_to_db.assert_called_once()
+        self.assertEqual(last_msg_ids, {(123, 456): 2})
 
     def test_extract_from_group_id_forum(self):
         """
@@ -178,6 +450,104 @@ class TestTelegramExtractor(unittest.TestCase):
         self.assertEqual(result, 3)
         self.extractor.extract_from_topic.assert_awaited_once()
 
+    def test_storage_calls_run_on_db_writer_thread(self):
+        """Storage writes run on the extractor's dedicated database thread."""
+        # Arrange
+        threads = []
+        self.mock_storage.save_messages_to_db.side_effect = lambda *args: (
+            threads.append(threading.current_thread().name)
+        )
+
+        # Act
+        async def run_test():
+            await self.extractor._save_chunk("t", 1, [], {}, (1, 1), 5)
+            await self.extractor.aclose()
+
+        asyncio.run(run_test())
+
+        # Assert
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("db-writer"))
+
+    def test_extract_from_group_id_uses_cached_meta(self):
+        """
+        Test that fresh cached metadata skips the entity and topic lookups.
+        """
+        # Arrange
+        cached_entity = SimpleNamespace(id=123, title="Cached Forum", is_forum=True)
+        cached_topic = SimpleNamespace(message_thread_id=7, name="Cached Topic")
+        self.mock_storage.get_group_meta.return_value = (cached_entity, [cached_topic])
+        self.extractor.extract_from_topic = AsyncMock(return_value=4)
+
+        # Act
+        result = asyncio.run(self.extractor.extract_from_group_id(123, {}))
+
+        # Assert
+        self.assertEqual(result, 4)
+        self.mock_client.get_chat.assert_not_awaited()
+        self.mock_client.get_forum_topics.assert_not_called()
+        self.mock_storage.save_group_meta.assert_not_called()
+        self.extractor.extract_from_topic.assert_awaited_once_with(
+            cached_entity, cached_topic, {}, None, "Cached Topic"
+        )
+
+    def test_extract_from_group_id_caches_fetched_meta(self):
+        """
+        Test that fetched topics are cached, and an error drops the cache entry.
+        """
+        # Arrange
+        mock_entity = MagicMock(id=123, title="Forum", is_forum=True)
+        mock_topic = MagicMock(message_thread_id=7)
+        self.mock_client.get_forum_topics.return_value = MockAsyncIterator([mock_topic])
+        self.extractor.extract_from_topic = AsyncMock(
+            side_effect=RuntimeError("CHANNEL_PRIVATE")
+        )
+
+        # Act
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.extractor.extract_from_group_id(123, {}, mock_entity))
+
+        # Assert
+        self.mock_storage.save_group_meta.assert_called_once_with(
+            123, mock_entity, [mock_topic]
+        )
+        self.mock_storage.invalidate_group_meta.assert_called_once_with(123)
+
+    def test_topics_extracted_while_listing_continues(self):
+        """
+        Test that a topic's extraction starts before the topic listing ends.
+        """
+        # Arrange
+        mock_entity = MagicMock(id=123, title="Forum", is_forum=True)
+        first, second = MagicMock(message_thread_id=1), MagicMock(message_thread_id=2)
+
+        async def run_test():
+            first_started = asyncio.Event()
+
+            async def list_topics(_group_id):
+                yield first
+                # The listing only continues once the first topic is running
+                await asyncio.wait_for(first_started.wait(), timeout=1)
+                yield second
+
+            async def fake_extract(entity, topic, *args):
+                if topic is first:
+                    first_started.set()
+                return topic.message_thread_id
+
+            self.mock_client.get_forum_topics = list_topics
+            self.extractor.extract_from_topic = fake_extract
+            return await self.extractor.extract_from_group_id(123, {}, mock_entity)
+
+        # Act
+        result = asyncio.run(run_test())
+
+        # Assert
+        self.assertEqual(result, 3)
+        self.mock_storage.save_group_meta.assert_called_once_with(
+            123, mock_entity, [first, second]
+        )
+
     def test_inputchannel_construction_with_channel_id(self):
         """Test InputChannel construction when entity has channel_id attribute."""
         # Arrange
@@ -241,6 +611,69 @@ class TestTelegramExtractor(unittest.TestCase):
         self.mock_client.get_forum_topics.assert_called_once_with(123)
         self.extractor.extract_from_topic.assert_called_once()
 
+    @patch("src.history_extractor.telegram_extractor.random.uniform", return_value=0)
+    def test_forum_topics_extracted_concurrently_with_bound(self, _mock_uniform):
+        """Topics run in parallel, never more than concurrent_topics at once."""
+        # Arrange
+        from pyrogram.errors import FloodWait
+
+        mock_entity = MagicMock()
+        mock_entity.id = 123
+        mock_entity.title = "Test Forum Group"
+        topics = [MagicMock(name=f"topic{i}") for i in range(5)]
+        self.mock_client.get_forum_topics.return_value = MockAsyncIterator(list(topics))
+        self.extractor.settings.telegram.extraction.concurrent_topics = 2
+
+        running = 0
+        peak = 0
+        flooded = []
+
+        async def fake_extract(
+            entity, topic, last_msg_ids, lock=None, topic_title=None
+        ):
+            nonlocal running, peak
+            if topic is topics[0] and not flooded:
+                flooded.append(topic)
+                raise FloodWait(value=0)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return 2
+
+        self.extractor.extract_from_topic = fake_extract
+
+        # Act
+        result = asyncio.run(self.extractor.extract_from_group_id(123, {}, mock_entity))
+
+        # Assert - the flooded topic is retried on its own, not the whole group
+        self.assertEqual(result, 10)
+        self.assertEqual(peak, 2)
+        self.assertEqual(self.mock_client.get_forum_topics.call_count, 1)
+        self.mock_storage.save_topics.assert_called_once_with(topics, 123)
+
+    @patch("src.history_extractor.telegram_extractor.FLOOD_WAIT_MAX_RETRIES", 1)
+    @patch("src.history_extractor.telegram_extractor.random.uniform", return_value=0)
+    def test_topic_flood_waits_are_bounded(self, _mock_uniform):
+        """A topic that keeps hitting FloodWait gives up instead of looping."""
+        # Arrange
+        from pyrogram.errors import FloodWait
+
+        mock_entity = MagicMock()
+        mock_entity.id = 123
+        mock_entity.title = "Test Forum Group"
+        self.mock_client.get_forum_topics.side_effect = lambda _id: MockAsyncIterator(
+            [MagicMock(name="topic")]
+        )
+        self.extractor.extract_from_topic = AsyncMock(side_effect=FloodWait(value=0))
+
+        # Act / Assert - one topic retry, then one group retry, then it surfaces
+        with self.assertRaises(FloodWait):
+            asyncio.run(self.extractor.extract_from_group_id(123, {}, mock_entity))
+        self.assertEqual(self.extractor.extract_from_topic.call_count, 4)
+        # Progress is persisted before every wait
+        self.assertEqual(self.mock_storage.save_last_msg_ids.call_count, 3)
+
     def test_get_forum_topics_raw_api_failure_fallback(self):
         """Test GetForumTopics raw API failure with fallback to regular group."""
         # Arrange
@@ -282,6 +715,39 @@ class TestTelegramExtractor(unittest.TestCase):
         self.assertEqual(extractor.client, self.mock_client)
         self.assertEqual(extractor.storage, self.mock_storage)
 
+    @patch("src.history_extractor.telegram_extractor.get_message_details")
+    def test_extract_from_general_topic(self, mock_get_message_details):
+        """The shared GENERAL_TOPIC works as a topic for regular groups."""
+        # Arrange
+        from datetime import datetime
+
+        from src.history_extractor.telegram_extractor import GENERAL_TOPIC
+
+        mock_entity = MagicMock()
+        mock_entity.id = 123
+        mock_entity.title = "Test Group"
+
+        mock_msg = MagicMock()
+        mock_msg.id = 1
+        mock_msg.date = datetime(2024, 1, 1)
+        mock_msg.from_user = None
+        mock_msg.sender_chat = None
+        mock_msg.message_thread_id = None  # Not part of any forum topic
+        mock_msg.reply_to_message_id = None
+        mock_msg.service = False
+        self.mock_client.get_chat_history.return_value = MockAsyncIterator([mock_msg])
+        mock_get_message_details.return_value = ("text", "hello", {})
+        last_msg_ids = {}
+
+        # Act
+        result = asyncio.run(
+            self.extractor.extract_from_topic(mock_entity, GENERAL_TOPIC, last_msg_ids)
+        )
+
+        # Assert
+        self.assertEqual(result, 1)
+        self.assertEqual(last_msg_ids, {(123, 0): 1})
+
     @patch("src.history_extractor.telegram_extractor.FloodWait")
     def test_flood_wait_error_handling(self, mock_flood_wait):
         """Test proper handling of FloodWait errors."""
@@ -307,6 +773,47 @@ class TestTelegramExtractor(unittest.TestCase):
         # Assert
         self.assertEqual(result, 10)  # Should return result from retry
 
+    @patch("src.history_extractor.telegram_extractor.random.uniform", return_value=0)
+    def test_flood_wait_retries_in_loop(self, _mock_uniform):
+        """A FloodWait is waited out and the group retried without recursion."""
+        # Arrange
+        from pyrogram.errors import FloodWait
+
+        mock_entity = MagicMock()
+        mock_entity.id = 123
+        mock_entity.title = "Test Group"
+        mock_entity.is_forum = False
+        self.mock_client.get_chat.side_effect = [FloodWait(value=0), mock_entity]
+        self.mock_client.get_forum_topics.return_value = MockAsyncIterator([])
+        self.extractor.extract_from_topic = AsyncMock(return_value=4)
+        last_msg_ids = {(123, 0): 9}
+
+        # Act
+        result = asyncio.run(self.extractor.extract_from_group_id(123, last_msg_ids))
+
+        # Assert - progress is persisted before waiting, then the group retried
+        self.assertEqual(result, 4)
+        self.assertEqual(self.mock_client.get_chat.call_count, 2)
+        self.mock_storage.save_last_msg_ids.assert_called_once_with({(123, 0): 9})
+
+    @patch("src.history_extractor.telegram_extractor.logger")
+    def test_sleep_with_heartbeat_logs_while_waiting(self, mock_logger):
+        """The wait is one sleep, with a side task logging the time left."""
+
+        # Act
+        async def run_test():
+            await self.extractor._sleep_with_heartbeat(0.05, interval=0.02)
+            logged = mock_logger.info.call_count
+            await asyncio.sleep(0.05)
+            return logged
+
+        logged = asyncio.run(run_test())
+
+        # Assert - logged repeatedly, and the heartbeat stopped with the wait
+        self.assertGreaterEqual(logged, 2)
+        self.assertEqual(mock_logger.info.call_count, logged)
+        mock_logger.info.assert_any_call("Waiting for 0 more seconds...")
+
     def test_parameter_validation_in_constructor(self):
         """Test that constructor validates required parameters."""
         # Arrange & Act & Assert
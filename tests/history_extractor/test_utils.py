@@ -0,0 +1,13 @@
+import unittest
+
+from src.history_extractor.utils import safe_filename
+
+
+class TestSafeFilename(unittest.TestCase):
+    def test_ascii_and_unicode_inputs(self):
+        """Every character outside [a-zA-Z0-9_-] becomes an underscore."""
+        self.assertEqual(
+            safe_filename("My Group: #42 (a-b_c)"), "My_Group___42__a-b_c_"
+        )
+        self.assertEqual(safe_filename("Группа 2024"), "_______2024")
+        self.assertEqual(safe_filename(""), "")
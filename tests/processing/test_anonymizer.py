@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 import unittest
@@ -27,6 +28,14 @@ class TestAnonymizer(unittest.TestCase):
         self.assertEqual(anonymizer.anonymize("user_a"), "User_1")
         self.assertEqual(anonymizer.anonymize("12345"), "User_3")
 
+    def test_anonymize_int_and_str_ids_share_an_alias(self):
+        """Test that a sender ID maps to one alias whether given as int or str."""
+        anonymizer = Anonymizer(self.mock_path_settings)
+        self.assertEqual(anonymizer.anonymize(12345), "User_1")
+        self.assertEqual(anonymizer.anonymize("12345"), "User_1")
+        self.assertEqual(anonymizer.anonymize(12345), "User_1")
+        self.assertEqual(anonymizer.user_map, {"12345": "User_1"})
+
     def test_persist_and_load_user_map(self):
         """Test that the user map is correctly saved to and loaded from a file."""
         # First instance
@@ -41,6 +50,22 @@ class TestAnonymizer(unittest.TestCase):
         self.assertEqual(anonymizer2.anonymize("user_b"), "User_2")
         self.assertEqual(anonymizer2.anonymize("user_c"), "User_3")
 
+    def test_load_user_map_stores_counter(self):
+        """Test that the counter is persisted, and still derived for older files."""
+        anonymizer = Anonymizer(self.mock_path_settings)
+        anonymizer.anonymize("user_a")
+        anonymizer.persist()
+        with open(self.mock_path_settings.user_map_file, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"next": 2, "map": {"user_a": "User_1"}})
+
+        # An older file holds only the map
+        with open(self.mock_path_settings.user_map_file, "w") as f:
+            json.dump({"user_a": "User_1", "user_b": "User_7"}, f)
+
+        anonymizer = Anonymizer(self.mock_path_settings)
+        self.assertEqual(anonymizer.next_user_num, 8)
+        self.assertEqual(anonymizer.anonymize("user_b"), "User_7")
+
     def test_load_corrupted_user_map(self):
         """Test that the anonymizer starts fresh if the user map is corrupted."""
         # Create a corrupted user map file
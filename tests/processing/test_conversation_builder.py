@@ -2,7 +2,7 @@ import unittest
 from datetime import datetime, timedelta
 
 from src.core.config import ConversationSettings
-from src.processing.conversation_builder import ConversationBuilder
+from src.processing.conversation_builder import ConversationBuilder, LRUMessageMap
 
 
 def create_message(msg_id, timestamp, sender, topic=None, content="..."):
@@ -153,3 +153,42 @@ class TestConversationBuilder(unittest.TestCase):
         conversations = list(self.builder.process_stream(iter(messages)))
         self.assertEqual(len(conversations), 1)
         self.assertEqual(len(conversations[0]["conversation"]), 2)
+
+    def test_uses_presorted_timestamps(self):
+        """A "_ts" set by ExternalSorter replaces parsing the date, and is dropped."""
+        messages = [
+            {"id": 1, "date": "unparsed", "_ts": 1000.0, "content": "a"},
+            {"id": 2, "date": "unparsed", "_ts": 1010.0, "content": "b"},
+            {"id": 3, "date": "unparsed", "_ts": 5000.0, "content": "c"},
+        ]
+        conversations = list(self.builder.process_stream(iter(messages)))
+        self.assertEqual([c["message_count"] for c in conversations], [2, 1])
+        self.assertNotIn("_ts", conversations[0]["conversation"][0])
+
+    def test_reply_finds_parent_after_older_conversation_closes(self):
+        """Replies still reach their parent once earlier conversations are flushed."""
+        now = datetime.now()
+        builder = ConversationBuilder(self.settings, max_active=2)
+        messages = [
+            create_message(1, now, "user1", topic=101),
+            create_message(2, now + timedelta(seconds=1), "user2", topic=102),
+            create_message(3, now + timedelta(seconds=2), "user3", topic=103),
+            create_message(4, now + timedelta(seconds=3), "user1", topic=104),
+        ]
+        messages[3]["reply_to_msg_id"] = 2
+
+        conversations = list(builder.process_stream(iter(messages)))
+
+        ids = [[m["id"] for m in c["conversation"]] for c in conversations]
+        self.assertIn([2, 4], ids)
+
+    def test_message_map_evicts_oldest_in_batches(self):
+        """Going over capacity drops the oldest-inserted 5% of entries."""
+        msg_map = LRUMessageMap(maxlen=40)
+        for msg_id in range(41):
+            msg_map.set(msg_id, f"conv{msg_id}")
+
+        self.assertEqual(len(msg_map), 39)
+        self.assertIsNone(msg_map.get_recent(0))
+        self.assertIsNone(msg_map.get_recent(1))
+        self.assertEqual(msg_map.get_recent(40), "conv40")
@@ -1,7 +1,11 @@
-import json
+import io
 import unittest
 from unittest.mock import MagicMock, call, mock_open, patch
 
+import orjson
+
+from src.core.serializer import date_to_timestamp
+from src.processing.data_source import DataSource
 from src.processing.external_sorter import ExternalSorter
 
 
@@ -18,6 +22,11 @@ class TestExternalSorter(unittest.TestCase):
         self.mock_data_source = MagicMock()
         self.mock_data_source.__iter__.return_value = iter(self.records)
 
+    @staticmethod
+    def _record(msg_id, date):
+        """A record as written to a chunk file, with its parsed timestamp."""
+        return {"id": msg_id, "date": date, "_ts": date_to_timestamp(date)}
+
     @patch("os.remove")
     @patch("tempfile.mkstemp")
     def test_write_sorted_chunks(self, mock_mkstemp, mock_os_remove):
@@ -45,12 +54,12 @@ class TestExternalSorter(unittest.TestCase):
         write_calls = handle.write.call_args_list
 
         # Expected content for the first chunk (records 1 and 2, sorted by date)
-        expected_line1 = json.dumps({"id": 2, "date": "2023-01-01T12:01:00"}) + "\n"
-        expected_line2 = json.dumps({"id": 1, "date": "2023-01-01T12:05:00"}) + "\n"
+        expected_line1 = orjson.dumps(self._record(2, "2023-01-01T12:01:00")) + b"\n"
+        expected_line2 = orjson.dumps(self._record(1, "2023-01-01T12:05:00")) + b"\n"
 
         # This is tricky because all writes go to the same mock_open handle.
         # We just check that the sorted lines were written.
-        written_content = "".join(c.args[0] for c in write_calls)
+        written_content = b"".join(c.args[0] for c in write_calls)
         self.assertIn(expected_line1, written_content)
         self.assertIn(expected_line2, written_content)
 
@@ -64,16 +73,16 @@ class TestExternalSorter(unittest.TestCase):
 
         # Create mock file content
         chunk1_content = (
-            json.dumps({"id": 2, "date": "2023-01-01T12:01:00"})
-            + "\n"
-            + json.dumps({"id": 5, "date": "2023-01-01T12:04:00"})
-            + "\n"
+            orjson.dumps(self._record(2, "2023-01-01T12:01:00"))
+            + b"\n"
+            + orjson.dumps(self._record(5, "2023-01-01T12:04:00"))
+            + b"\n"
         )
         chunk2_content = (
-            json.dumps({"id": 3, "date": "2023-01-01T12:02:00"})
-            + "\n"
-            + json.dumps({"id": 4, "date": "2023-01-01T12:03:00"})
-            + "\n"
+            orjson.dumps(self._record(3, "2023-01-01T12:02:00"))
+            + b"\n"
+            + orjson.dumps(self._record(4, "2023-01-01T12:03:00"))
+            + b"\n"
         )
 
         mock_files = {
@@ -98,8 +107,7 @@ class TestExternalSorter(unittest.TestCase):
 
     @patch("os.remove")
     @patch("tempfile.mkstemp")
-    @patch("gzip.open")
-    def test_sort_with_gzip(self, mock_gzip_open, mock_mkstemp, mock_os_remove):
+    def test_sort_with_gzip(self, mock_mkstemp, mock_os_remove):
         """
         Test that gzip is used when enabled.
         """
@@ -109,13 +117,40 @@ class TestExternalSorter(unittest.TestCase):
 
         # Act
         m_open = mock_open()
-        with patch("builtins.open", mock_open()), patch("gzip.open", m_open):
+        with (
+            patch("builtins.open", mock_open()),
+            patch("src.processing.external_sorter._BufferedGzipFile", m_open),
+        ):
             # We only need to test the write phase
             sorter._write_sorted_chunks(self.mock_data_source)
 
         # Assert
-        # Check that gzip.open was used for writing
-        m_open.assert_called_once_with("/tmp/chunk1.gz", "wt", encoding="utf-8")
+        # Check that a gzip file was used for writing
+        m_open.assert_called_once_with("/tmp/chunk1.gz", "wb", 1)
+
+    def test_gzip_temp_file_is_buffered_and_closed(self):
+        """
+        Test that gzip spill files sit on a buffered raw file closed with them.
+        """
+        import os
+        import tempfile
+
+        # Arrange
+        sorter = ExternalSorter(use_gzip=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "chunk.jsonl.gz")
+
+            # Act
+            with sorter._open_temp(path, "w") as w:
+                w.write(b"line\n")
+                raw = w._raw
+            with sorter._open_temp(path, "r") as r:
+                data = r.read()
+
+        # Assert
+        self.assertEqual(data, b"line\n")
+        self.assertTrue(raw.closed)
+        self.assertIsInstance(raw, io.BufferedWriter)
 
     def test_sort_empty_data_source(self):
         """
@@ -130,3 +165,50 @@ class TestExternalSorter(unittest.TestCase):
 
         # Assert
         self.assertEqual(sorted_records, [])
+
+    @patch("tempfile.mkstemp")
+    def test_sort_streams_ordered_data_source(self, mock_mkstemp):
+        """
+        Test that a date-ordered DataSource is streamed without chunk files.
+        """
+        # Arrange
+        sorter = ExternalSorter()
+        mock_db = MagicMock()
+        mock_db.get_all_messages.return_value = iter(
+            [
+                {"id": 1, "date": "2023-01-01T12:01:00"},
+                {"id": 2, "date": "invalid-date"},
+                {"id": 3, "date": "2023-01-01T12:02:00"},
+            ]
+        )
+
+        # Act
+        sorted_records = list(sorter.sort(DataSource(mock_db)))
+
+        # Assert
+        self.assertEqual(
+            sorted_records,
+            [
+                self._record(1, "2023-01-01T12:01:00"),
+                self._record(3, "2023-01-01T12:02:00"),
+            ],
+        )
+        mock_mkstemp.assert_not_called()
+
+    def test_sort_end_to_end_with_background_writes(self):
+        """
+        Test a full sort through several chunks written on the writer thread.
+        """
+        # Arrange
+        sorter = ExternalSorter(chunk_size=2)
+
+        # Act
+        with (
+            patch("src.processing.external_sorter.MAX_PENDING_CHUNKS", 1),
+            patch.object(sorter, "_write_chunk", wraps=sorter._write_chunk) as spy,
+        ):
+            sorted_records = list(sorter.sort(self.mock_data_source))
+
+        # Assert
+        self.assertEqual([r["id"] for r in sorted_records], [2, 4, 3, 5, 1])
+        self.assertEqual(spy.call_count, 3)
@@ -99,6 +99,15 @@ def test_normalize_numbers(pipeline_setup):
     assert result == expected
 
 
+def test_normalize_numbers_unit_casing():
+    """Units are lowercased whether or not the spelling is in the lookup table."""
+    from src.core.text_utils import normalize_numbers
+
+    result = normalize_numbers("5 Km, 6 KG and 7 kM")
+
+    assert [r["unit"] for r in result] == ["km", "kg", "km"]
+
+
 def test_process_record(pipeline_setup):
     """
     Test the processing of a single record.
@@ -115,3 +124,75 @@ def test_process_record(pipeline_setup):
     assert len(processed_record["normalized_values"]) == 1
     assert processed_record["normalized_values"][0]["value"] == 500.0
     assert processed_record["normalized_values"][0]["unit"] == "kg"
+
+
+def test_write_conversations_round_trip(pipeline_setup, tmp_path):
+    """The output file is one JSON array, with non-ASCII text kept as UTF-8."""
+    import json
+
+    output_file = tmp_path / "conversations.json"
+    convs = [{"conversation": [{"content": "नमस्ते"}]}, {"message_count": 2}]
+
+    count = pipeline_setup["pipeline"]._write_conversations(
+        iter(convs), str(output_file)
+    )
+
+    assert count == 2
+    assert json.loads(output_file.read_text(encoding="utf-8")) == convs
+    assert "नमस्ते" in output_file.read_text(encoding="utf-8")
+
+
+def test_write_conversations_in_batches(pipeline_setup, tmp_path):
+    """Envelopes spanning several write batches still form one JSON array."""
+    import json
+
+    output_file = tmp_path / "conversations.json"
+    convs = [{"message_count": i} for i in range(5)]
+
+    with patch("src.processing.pipeline.WRITE_BATCH_SIZE", 2):
+        count = pipeline_setup["pipeline"]._write_conversations(
+            iter(convs), str(output_file)
+        )
+
+    assert count == 5
+    assert json.loads(output_file.read_text(encoding="utf-8")) == convs
+
+
+def test_write_conversations_keeps_order_with_queued_writes(pipeline_setup, tmp_path):
+    """Batches queued on the writer thread land in the file in stream order."""
+    import json
+
+    output_file = tmp_path / "conversations.json"
+    convs = [{"message_count": i} for i in range(50)]
+
+    with patch("src.processing.pipeline.WRITE_BATCH_SIZE", 1):
+        count = pipeline_setup["pipeline"]._write_conversations(
+            iter(convs), str(output_file)
+        )
+
+    assert count == 50
+    assert json.loads(output_file.read_text(encoding="utf-8")) == convs
+
+
+def test_normalize_numbers_without_digits():
+    """Text without digits yields no numbers, including unit words alone."""
+    from src.core.text_utils import normalize_numbers
+
+    assert normalize_numbers("a million thanks, 100 percent") != []
+    assert normalize_numbers("a million thanks, percent") == []
+
+
+def test_process_record_interns_repeated_fields(pipeline_setup):
+    """Equal topic titles from different records end up as one string object."""
+    title_a = "".join(["Gen", "eral"])
+    title_b = "".join(["Gene", "ral"])
+    assert title_a is not title_b
+
+    rec_a = pipeline_setup["pipeline"]._process_record(
+        {"topic_title": title_a, "content": ""}, pipeline_setup["mock_anonymizer"]
+    )
+    rec_b = pipeline_setup["pipeline"]._process_record(
+        {"topic_title": title_b, "content": ""}, pipeline_setup["mock_anonymizer"]
+    )
+
+    assert rec_a["topic_title"] is rec_b["topic_title"]
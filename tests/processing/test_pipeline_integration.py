@@ -78,6 +78,12 @@ class TestPipelineIntegration(unittest.TestCase):
         self.app_context.settings.paths.user_map_file = os.path.join(
             self.temp_dir, "processed", "user_map.json"
         )
+        self.app_context.settings.paths.group_meta_file = os.path.join(
+            self.temp_dir, "group_meta.json"
+        )
+        self.app_context.settings.paths.tracking_file = os.path.join(
+            self.temp_dir, "last_msg_ids.json"
+        )
         os.makedirs(self.app_context.settings.paths.raw_data_dir, exist_ok=True)
         os.makedirs(self.app_context.settings.paths.processed_data_dir, exist_ok=True)
 
@@ -387,7 +393,7 @@ class TestPipelineIntegration(unittest.TestCase):
     def test_database_transaction_rollback_on_failure(self):
         """Test database transaction rollback on processing failure."""
         # Arrange
-        with patch("src.core.database.Database._batch_insert_messages") as mock_insert:
+        with patch("src.core.database.Database._insert_rows") as mock_insert:
             mock_insert.side_effect = sqlite3.IntegrityError("UNIQUE constraint failed")
 
             messages = [
@@ -560,6 +566,8 @@ class TestProductionLoadScenarios(unittest.TestCase):
         start_time = time.time()
 
         storage.save_messages_to_db("Test Group", 101, large_dataset)
+        # Rows are buffered across topics until the buffer fills or ages out
+        storage.close()
 
         end_time = time.time()
         processing_time = end_time - start_time
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -119,3 +120,65 @@ class TestLiteLLMClient(unittest.TestCase):
         self.assertEqual(result, [[0.1, 0.2, 0.3]])
         self.assertEqual(mock_router.embedding.call_count, 2)
         self.assertEqual(mock_sleep.call_count, 1)
+
+    @patch("src.rag.litellm_client._get_router")
+    def test_embed_batch_splits_large_inputs(self, mock_get_router):
+        """Test that embed_batch sends capped groups and keeps input order."""
+        mock_router = MagicMock()
+        mock_router.embedding.side_effect = lambda model, input: {
+            "data": [{"embedding": [float(text)]} for text in input]
+        }
+        mock_get_router.return_value = mock_router
+        texts = [str(i) for i in range(5)]
+
+        result = litellm_client.embed_batch(texts, batch_size=2)
+
+        self.assertEqual(result, [[0.0], [1.0], [2.0], [3.0], [4.0]])
+        self.assertEqual(
+            [c.kwargs["input"] for c in mock_router.embedding.call_args_list],
+            [["0", "1"], ["2", "3"], ["4"]],
+        )
+
+    @patch("src.rag.litellm_client._get_router")
+    def test_embed_many_runs_batches_concurrently(self, mock_get_router):
+        """Test that embed_many overlaps requests and reassembles them in order."""
+        in_flight = []
+        peak = []
+
+        async def aembedding(model, input):
+            in_flight.append(input)
+            peak.append(len(in_flight))
+            # Later groups finish first, so order must come from gather
+            await asyncio.sleep(0.01 * (5 - int(input[0])))
+            in_flight.remove(input)
+            return {"data": [{"embedding": [float(text)]} for text in input]}
+
+        mock_router = MagicMock()
+        mock_router.aembedding.side_effect = aembedding
+        mock_get_router.return_value = mock_router
+        texts = [str(i) for i in range(5)]
+
+        result = litellm_client.embed_many(texts, batch_size=1, max_in_flight=3)
+
+        self.assertEqual(result, [[0.0], [1.0], [2.0], [3.0], [4.0]])
+        self.assertEqual(max(peak), 3)
+        mock_router.embedding.assert_not_called()
+
+    @patch("src.rag.litellm_client._get_router")
+    def test_embed_many_inside_running_loop_falls_back(self, mock_get_router):
+        """Test that embed_many works when called from a running event loop."""
+        mock_router = MagicMock()
+        mock_router.embedding.side_effect = lambda model, input: {
+            "data": [{"embedding": [float(text)]} for text in input]
+        }
+        mock_get_router.return_value = mock_router
+        texts = [str(i) for i in range(3)]
+
+        async def call_from_loop():
+            return litellm_client.embed_many(texts, batch_size=2)
+
+        result = asyncio.run(call_from_loop())
+
+        self.assertEqual(result, [[0.0], [1.0], [2.0]])
+        self.assertEqual(mock_router.embedding.call_count, 2)
+        mock_router.aembedding.assert_not_called()
@@ -214,13 +214,13 @@ def test_embedding_function_wrapper(mock_litellm_client):
     """Test the LiteLLMEmbeddingFunction wrapper."""
     import numpy as np
 
-    mock_litellm_client.embed.return_value = [[0.1, 0.2]]
+    mock_litellm_client.embed_many.return_value = [[0.1, 0.2]]
 
     embed_func = LiteLLMEmbeddingFunction("test-model")
 
     # Test __call__
     result = embed_func(["test input"])
-    mock_litellm_client.embed.assert_called_once_with(["test input"])
+    mock_litellm_client.embed_many.assert_called_once_with(["test input"])
     np.testing.assert_allclose(result, [[0.1, 0.2]], rtol=1e-6)
 
     # Test name
@@ -26,7 +26,7 @@ class TestNuggetEmbedder(unittest.TestCase):
             {"detailed_analysis": "analysis 2"},
         ]
         mock_embeddings = [[0.1], [0.2]]
-        mock_litellm_client.embed.return_value = mock_embeddings
+        mock_litellm_client.embed_batch.return_value = mock_embeddings
 
         # Act
         result = self.nugget_embedder.embed_nuggets_batch(nuggets)
@@ -35,6 +35,6 @@ class TestNuggetEmbedder(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]["embedding"], [0.1])
         self.assertEqual(result[1]["embedding"], [0.2])
-        mock_litellm_client.embed.assert_called_once_with(
+        mock_litellm_client.embed_batch.assert_called_once_with(
             ["analysis 1", "analysis 2"], max_retries=1
         )